@@ -5,12 +5,15 @@ from translatable import Translatable
 
 class Arrow(Polygon, Translatable, Named):
     def __init__(self, position = (0, 0), node_list = []):
-        Polygon.__init__(self, node_list)
+        # the glyph of a direction class is shared, so every arrow gets its own nodes
+        Polygon.__init__(self, [Node(node[0], node[1], node.style(), node.fusable()) for node in node_list])
         Translatable.__init__(self, position)
         Named.__init__(self)
         self.add_name('_arrow_')
 
     def scale(self, scale):
+        if isinstance(scale, (float, int)):
+            scale = (scale, scale)
         Translatable.scale(self, scale)
         Polygon.scale(self, scale)
         return
@@ -6,9 +6,11 @@ from leftarrow import LeftArrow
 from uparrow import UpArrow
 from downarrow import DownArrow
 from parser import Parser
+from charactergrid import CharacterGrid
+from gridgraph import GridGraph
+from spatialindex import SpatialIndex
 from drawable import *
 from graphalgorithms import angle
-import networkx
 
 class ArrowParser(Parser):
     def __init__(self):
@@ -22,39 +24,53 @@ class ArrowParser(Parser):
     def edges(self):
         return self.__graph.edges()
 
+    def __node_owners(self, drawable_objects):
+        owners = {}
+        for obj in drawable_objects:
+            if isinstance(obj, OpenGraph) or isinstance(obj, Polygon):
+                for position in set([node.position() for node in obj.nodes()]):
+                    owners.setdefault(position, []).append(obj)
+        return owners
+
     def run(self, raw_data, drawable_objects):
         arrows = []
-        for y in range(0, len(raw_data)):
-            for x in range(0, len(raw_data[0])): 
-                if raw_data[y][x] in self._arrows.keys():
-                    arrow = self._arrows[raw_data[y][x]]((x + 0.5, y + 0.5))
-                    arrows.append(arrow)
+        grid = next((obj for obj in drawable_objects if isinstance(obj, CharacterGrid)), None)
+        if grid == None:
+            grid = CharacterGrid(raw_data)
+        for x, y, character in grid.cells(CharacterGrid.ARROW):
+            arrow = self._arrows[character]((x + 0.5, y + 0.5))
+            arrows.append(arrow)
 
         # snap arrows to objects near them
         graph = None
         try:
-            graph = next(obj for obj in drawable_objects if type(obj) == nx.Graph)
+            graph = next(obj for obj in drawable_objects if isinstance(obj, GridGraph))
         except StopIteration:
             pass
         if graph != None:
+            graph_nodes = graph.nodes()
+            node_index = SpatialIndex(1)
+            for i in range(0, len(graph_nodes)):
+                node_index.insert(i, graph_nodes[i].position())
+            owners = None
             for arrow in arrows:
                 connector = Node(*(arrow.tip()))
-                nodes_in_front = [node for node in graph.nodes() if (node == connector) or angle(arrow.direction(), node - connector) <= 90]
+                # only nodes up to 0.5 away from the tip can be snapped to
+                nodes_near = [graph_nodes[i] for i in node_index.query((connector[0] - 0.5, connector[1] - 0.5), (connector[0] + 0.5, connector[1] + 0.5))]
+                nodes_in_front = [node for node in nodes_near if (node == connector) or angle(arrow.direction(), node - connector) <= 90]
                 if nodes_in_front:
                     nearest_node = min(nodes_in_front, key=lambda node: (node - connector.position()).length())
                     diff = nearest_node - connector
                     if diff.length() <= 0.5:
+                        if owners == None:
+                            owners = self.__node_owners(drawable_objects)
                         connector = Node(*(arrow.connector()))
                         path = [connector, connector + diff]
-                        for obj in drawable_objects:
-                            if isinstance(obj, OpenGraph):
-                                if obj.has_node(connector):
-                                    obj.add_path(path)
-                            elif isinstance(obj, Polygon):
-                                if obj.frame().has_node(connector):
-                                    obj.frame().add_path(path)
+                        for obj in owners.get(connector.position(), []):
+                            if isinstance(obj, Polygon):
+                                obj.frame().add_path(path)
                             else:
-                                pass
+                                obj.add_path(path)
                         arrow.translate(diff)
         self._objects = drawable_objects + arrows
         drawable_objects += arrows
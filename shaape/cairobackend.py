@@ -9,6 +9,7 @@ import networkx as nx
 from translatable import Translatable
 from rotatable import Rotatable
 from node import Node
+from arrow import Arrow
 import pangocairo
 import pango
 import warnings
@@ -23,6 +24,7 @@ class CairoBackend(DrawingBackend):
         self.__surfaces = []
         self.__ctx = None
         self.__drawn_graph = None
+        self.__glyph_paths = {}
         self.__font_map = pangocairo.cairo_font_map_get_default()
         self.__available_font_names = [f.get_name() for f in self.__font_map.list_families()]
         return
@@ -151,7 +153,10 @@ class CairoBackend(DrawingBackend):
         self.apply_fill(polygon)
         self.apply_transform(polygon)
         nodes = polygon.nodes()
-        self.apply_path(nodes)
+        if isinstance(polygon, Arrow):
+            self.apply_glyph(nodes)
+        else:
+            self.apply_path(nodes)
         self.__ctx.fill()
         self.__ctx.restore()
         return
@@ -162,7 +167,10 @@ class CairoBackend(DrawingBackend):
         self.__ctx.set_operator(cairo.OPERATOR_SOURCE)
         self.apply_transform(polygon)
         nodes = polygon.nodes()
-        self.apply_path(nodes)
+        if isinstance(polygon, Arrow):
+            self.apply_glyph(nodes)
+        else:
+            self.apply_path(nodes)
         self.__ctx.fill()
         self.__ctx.restore()
         return
@@ -188,12 +196,12 @@ class CairoBackend(DrawingBackend):
 
     def _transform_to_sharp_space(self, direction, node):
         if self.__ctx.get_line_width() % 2 == 1:
-            result = Node(node[0], node[1])
+            x, y = node[0], node[1]
             if direction[0] == 0:
-                result.set_position(result[0] + 0.5, result[1])
+                x = x + 0.5
             if direction[1] == 0:
-                result.set_position(result[0], result[1] + 0.5)
-            return result
+                y = y + 0.5
+            return Node(x, y)
         else:
             return node
 
@@ -236,6 +244,17 @@ class CairoBackend(DrawingBackend):
                 line_end = nodes[i]
         return
 
+    def apply_glyph(self, nodes):
+        # arrows of one direction have equal nodes, so their path is built once per backend
+        key = (tuple([(node.position(), node.style()) for node in nodes]), self.__ctx.get_line_width())
+        if key in self.__glyph_paths:
+            self.__ctx.append_path(self.__glyph_paths[key])
+        else:
+            self.__ctx.new_path()
+            self.apply_path(nodes)
+            self.__glyph_paths[key] = self.__ctx.copy_path()
+        return
+
     def draw_open_graph(self, open_graph):
         self.__ctx.save()
         self.apply_transform(open_graph)
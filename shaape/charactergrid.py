@@ -0,0 +1,121 @@
+import numpy as np
+import re
+
+class CharacterGrid(object):
+    OUTSIDE = -1
+    BLANK = 0
+    TEXT = 1
+    ARROW = 2
+    LINE = 3
+    JUNCTION = 4
+    ARROWS = u'<>^v'
+    LINES = u'-|/\\~[]()'
+    JUNCTIONS = u'+*'
+
+    def __init__(self, data = [], texts = []):
+        height = len(data)
+        if height > 0:
+            width = max([len(line) for line in data])
+        else:
+            width = 0
+        codes = np.empty((height, width), dtype = np.int32)
+        codes.fill(CharacterGrid.OUTSIDE)
+        for y in range(0, height):
+            line = data[y]
+            if len(line) > 0:
+                codes[y, :len(line)] = self.__line_codes(line)
+        characters, labels = np.unique(codes, return_inverse = True)
+        self.__lines = list(data)
+        self.__texts = texts
+        self.__codes = codes
+        self.__characters = characters.tolist()
+        self.__labels = labels.reshape(codes.shape)
+        self.__tables = {}
+
+        # cell positions grouped by character, row-major within each group
+        order = np.argsort(labels, kind = 'mergesort')
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(labels, minlength = len(self.__characters)))))
+        self.__positions = [order[bounds[i]:bounds[i + 1]] for i in range(0, len(self.__characters))]
+
+        self.__character_kinds = [self.__kind(c) for c in self.__characters]
+        self.__kinds = np.array(self.__character_kinds, dtype = np.int8)[self.__labels]
+        for text, position in texts:
+            self.__kinds[position[1], position[0]:position[0] + len(text)] = CharacterGrid.TEXT
+        return
+
+    def __line_codes(self, line):
+        if isinstance(line, unicode):
+            # one code per character of the line, which is a surrogate half on narrow builds
+            return np.array([ord(c) for c in line], dtype = np.int32)
+        else:
+            return np.frombuffer(line, dtype = np.uint8)
+
+    def __kind(self, code):
+        if code == CharacterGrid.OUTSIDE:
+            return CharacterGrid.OUTSIDE
+        character = unichr(code)
+        if character in CharacterGrid.ARROWS:
+            return CharacterGrid.ARROW
+        elif character in CharacterGrid.LINES:
+            return CharacterGrid.LINE
+        elif character in CharacterGrid.JUNCTIONS:
+            return CharacterGrid.JUNCTION
+        else:
+            return CharacterGrid.BLANK
+
+    def __table(self, pattern):
+        if not pattern in self.__tables:
+            if pattern == None:
+                table = [c != CharacterGrid.OUTSIDE for c in self.__characters]
+            else:
+                table = [c != CharacterGrid.OUTSIDE and re.match(pattern, unichr(c), re.UNICODE) != None for c in self.__characters]
+            self.__tables[pattern] = np.array(table + [False], dtype = bool)
+        return self.__tables[pattern]
+
+    def lines(self):
+        return self.__lines
+
+    def texts(self):
+        return self.__texts
+
+    def codes(self):
+        return self.__codes
+
+    def kinds(self):
+        return self.__kinds
+
+    def size(self):
+        return (self.__codes.shape[1], self.__codes.shape[0])
+
+    def inside(self):
+        return self.plane(None)
+
+    def plane(self, pattern):
+        return self.__table(pattern)[self.__labels]
+
+    def count(self, pattern):
+        table = self.__table(pattern)
+        return sum([len(self.__positions[i]) for i in range(0, len(self.__characters)) if table[i]])
+
+    def positions(self, pattern):
+        table = self.__table(pattern)
+        positions = [self.__positions[i] for i in range(0, len(self.__characters)) if table[i]]
+        if not positions:
+            return (np.zeros(0, dtype = int), np.zeros(0, dtype = int))
+        positions = np.sort(np.concatenate(positions))
+        return (positions % self.__codes.shape[1], positions // self.__codes.shape[1])
+
+    def matches(self, pattern, xs, ys):
+        labels = np.empty(len(xs), dtype = self.__labels.dtype)
+        labels.fill(len(self.__characters))
+        inside = (xs >= 0) & (ys >= 0) & (xs < self.__codes.shape[1]) & (ys < self.__codes.shape[0])
+        labels[inside] = self.__labels[ys[inside], xs[inside]]
+        return self.__table(pattern)[labels]
+
+    def cells(self, kind):
+        positions = [self.__positions[i] for i in range(0, len(self.__characters)) if self.__character_kinds[i] == kind]
+        if not positions:
+            return []
+        width = self.__codes.shape[1]
+        positions = np.sort(np.concatenate(positions)).tolist()
+        return [(p % width, p // width, unichr(self.__codes.flat[p])) for p in positions]
@@ -0,0 +1,58 @@
+from spatialindex import SpatialIndex
+from graphalgorithms import signed_area
+
+class ContainmentTree(object):
+    def __init__(self, polygons = []):
+        self.__polygons = list(polygons)
+        self.__bounds = {}
+        self.__areas = {}
+        sizes = []
+        for polygon in self.__polygons:
+            minimum, maximum = polygon.min(), polygon.max()
+            self.__bounds[polygon] = (minimum, maximum)
+            self.__areas[polygon] = abs(signed_area(polygon.nodes()))
+            sizes.append(max(maximum[0] - minimum[0], maximum[1] - minimum[1]))
+        if sizes:
+            cell_size = max(1, sum(sizes) / len(sizes))
+        else:
+            cell_size = SpatialIndex.DEFAULT_CELL_SIZE
+        self.__index = SpatialIndex(cell_size)
+        for polygon in self.__polygons:
+            self.__index.insert(polygon, *self.__bounds[polygon])
+        self.__parents = None
+        return
+
+    def __encloses(self, outer, inner):
+        outer_min, outer_max = outer
+        inner_min, inner_max = inner
+        return outer_min[0] <= inner_min[0] and outer_min[1] <= inner_min[1] and outer_max[0] >= inner_max[0] and outer_max[1] >= inner_max[1]
+
+    def __build(self):
+        self.__parents = dict((polygon, []) for polygon in self.__polygons)
+        ancestors = {}
+        for polygon in sorted(self.__polygons, key = lambda p: self.__areas[p], reverse = True):
+            bounds = self.__bounds[polygon]
+            candidates = [c for c in self.__index.query(*bounds) if c is not polygon and self.__areas[c] >= self.__areas[polygon] and self.__encloses(self.__bounds[c], bounds)]
+            # the smallest container is the parent, containers of a parent need no check
+            implied = set()
+            for candidate in sorted(candidates, key = lambda c: self.__areas[c]):
+                if not candidate in implied and candidate.contains(polygon):
+                    self.__parents[polygon].append(candidate)
+                    implied.add(candidate)
+                    implied.update(ancestors.get(candidate, []))
+            ancestors[polygon] = implied
+        return
+
+    def polygons(self):
+        return self.__polygons
+
+    def parents(self, polygon):
+        if self.__parents == None:
+            self.__build()
+        return self.__parents[polygon]
+
+    def edges(self):
+        return [(parent, polygon) for polygon in self.__polygons for parent in self.parents(polygon)]
+
+    def containing(self, point):
+        return [polygon for polygon in self.__index.query(point) if self.__encloses(self.__bounds[polygon], (point, point)) and polygon.contains(point)]
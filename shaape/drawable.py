@@ -3,10 +3,12 @@ import operator
 import networkx as nx
 from node import *
 from style import Style
+from resolvedstyle import ResolvedStyle
 
 class Drawable(object):
     def __init__(self):
         self.__style = Style([], '', [])
+        self.__resolved_style = None
         self.__z_order = 0
         return
 
@@ -19,9 +21,19 @@ class Drawable(object):
 
     def set_style(self, style):
         self.__style.merge(style)
+        self.__resolved_style = None
+        return
+
+    def resolve_style(self, resolved_styles = None):
+        style = ResolvedStyle(self.__style)
+        if resolved_styles != None:
+            style = resolved_styles.setdefault(style.key(), style)
+        self.__resolved_style = style
         return
 
     def style(self):
+        if self.__resolved_style != None:
+            return self.__resolved_style
         return self.__style
 
     def min(self):
@@ -1,3 +1,5 @@
+from graphalgorithms import line_segments_intersect
+
 class Edge:
     def __init__(self, node1, node2, above = None, below = None, z_order = None):
         self.__start = node1
@@ -30,8 +32,5 @@ class Edge:
     def z_order(self):
         return self.__z_order
 
-    def __ccw(self, a, b, c):
-	    return (c[1] - a[1]) * (b[0] - a[0]) > (b[1] - a[1]) * (c[0] - a[0])
-
     def intersects(self, edge):
-        return self.__ccw(self[0], edge[0], edge[1]) != self.__ccw(self[1], edge[0], edge[1]) and self.__ccw(self[0], self[1], edge[0]) != self.__ccw(self[0], self[1], edge[1])
+        return line_segments_intersect(self, edge)
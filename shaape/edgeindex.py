@@ -0,0 +1,47 @@
+from spatialindex import SpatialIndex
+from graphalgorithms import segment_array, line_segments_intersect_array
+import numpy as np
+
+class EdgeIndex(object):
+    def __init__(self, objects = []):
+        self.__owners = {}
+        self.__segments = SpatialIndex(1)
+        self.__segment_owners = []
+        segments = []
+        for obj in objects:
+            for edge in obj.edges():
+                owners = self.__owners.setdefault(frozenset(edge), [])
+                if not owners or owners[-1] is not obj:
+                    owners.append(obj)
+                self.__segments.insert(len(segments), *self.__bounds(edge))
+                self.__segment_owners.append(obj)
+                segments.append(edge)
+        self.__segment_array = segment_array(segments)
+        return
+
+    def __bounds(self, segment):
+        start, end = segment
+        return ((min(start[0], end[0]), min(start[1], end[1])), (max(start[0], end[0]), max(start[1], end[1])))
+
+    def owners(self, start, end):
+        return self.__owners.get(frozenset((start, end)), [])
+
+    def crossing(self, edge):
+        return self.crossings([edge])[0]
+
+    def crossings(self, edges):
+        candidates = [self.__segments.query(*self.__bounds(edge)) for edge in edges]
+        queries = np.repeat(np.arange(len(edges)), [len(c) for c in candidates])
+        segments = np.array([i for c in candidates for i in c], dtype = int)
+        hits = line_segments_intersect_array(self.__segment_array[segments], segment_array(edges)[queries])
+        crossings = []
+        hit = 0
+        for c in candidates:
+            crossing_objects = []
+            for i in c:
+                obj = self.__segment_owners[i]
+                if (not crossing_objects or crossing_objects[-1] is not obj) and hits[hit]:
+                    crossing_objects.append(obj)
+                hit = hit + 1
+            crossings.append(crossing_objects)
+        return crossings
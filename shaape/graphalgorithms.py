@@ -1,160 +1,360 @@
 import networkx as nx
 import numpy as np
 import math
+import collections
+from spatialindex import SpatialIndex
 
 def reduce_path(nodes):
-    new_nodes = []
     new_nodes = nodes[0:2]
     for i in range(2, len(nodes)):
-        previous_edge = nodes[i - 1] - nodes[i - 2]
-        current_edge = nodes[i] - nodes[i - 1]
-        if new_nodes[-1].fusable() == True and has_same_direction(previous_edge, current_edge):
+        if can_fuse(nodes[i - 2], nodes[i - 1], nodes[i]):
             new_nodes[-1] = nodes[i]
         else:
             new_nodes.append(nodes[i])
     if len(new_nodes) > 2 and new_nodes[0] == new_nodes[-1]:
-        first_edge = new_nodes[1] - new_nodes[0]
-        last_edge = new_nodes[-1] - new_nodes[-2]
-        if new_nodes[-1].fusable() == True and has_same_direction(first_edge, last_edge):
+        if can_fuse(new_nodes[-2], new_nodes[-1], new_nodes[1]):
             del new_nodes[-1]
             new_nodes[0] = new_nodes[-1]
     return new_nodes
 
-def has_same_direction(v1, v2):
-    if (v1[0] == 0 and v1[1] == 0) or (v2[0] == 0 and v2[1] == 0):
-        return False
-    if v2[0] == 0 and v1[0] == 0:
-        return True
-    elif v2[0] == 0:
-        return False
-    if v2[1] == 0 and v1[1] == 0:
-        return True
-    elif v2[1] == 0:
-        return False
+def can_fuse(previous, node, following):
+    return node.fusable() == True and has_same_direction(node - previous, following - node)
 
-    diff_x = float(v1[0]) / v2[0]
-    diff_y = float(v1[1]) / v2[1]
+# coordinates are compared as integer multiples of 1 / FIXED_POINT_SCALE,
+# which is exact for the quarter and half cell offsets of the overlays
+FIXED_POINT_SCALE = 1 << 16
 
-    if diff_x == diff_y or ((-1 * diff_x) == (-1 * diff_y)):
-        return True
-    else:
+def fixed_point(v):
+    return (int(round(v[0] * FIXED_POINT_SCALE)), int(round(v[1] * FIXED_POINT_SCALE)))
+
+def cross(v1, v2):
+    return v1[0] * v2[1] - v1[1] * v2[0]
+
+def orientation(a, b, c):
+    return cross((b[0] - a[0], b[1] - a[1]), (c[0] - a[0], c[1] - a[1]))
+
+def reduced_direction(v):
+    a, b = abs(v[0]), abs(v[1])
+    while b:
+        a, b = b, a % b
+    if a == 0:
+        return (0, 0)
+    return (v[0] / a, v[1] / a)
+
+# angles of the directions grid edges take, indexed by their reduced integer vector
+DIRECTION_ANGLES = dict((reduced_direction((x, y)), math.atan2(y, x)) for x in range(-4, 5) for y in range(-4, 5))
+
+def fixed_direction_angle(v):
+    direction = reduced_direction(v)
+    try:
+        return DIRECTION_ANGLES[direction]
+    except KeyError:
+        return math.atan2(direction[1], direction[0])
+
+def direction_angle(v):
+    return fixed_direction_angle(fixed_point(v))
+
+def has_same_direction(v1, v2):
+    v1 = fixed_point(v1)
+    v2 = fixed_point(v2)
+    if (v1[0] == 0 and v1[1] == 0) or (v2[0] == 0 and v2[1] == 0):
         return False
+    return cross(v1, v2) == 0
 
 def right_angle(v1, v2):
-    x = np.array([v1[0], v1[1]])
-    y = np.array([v2[0], v2[1]])
-    cross = np.cross(x, y)
-    dot = np.dot(x, y)
-    x_length = np.sqrt((x * x).sum())
-    y_length = np.sqrt((y * y).sum())
-    _angle = np.arccos(dot / x_length / y_length)
-    if x[0] * y[1] < y[0] * x[1]:
-        _angle = 2 * math.pi - _angle
-    return _angle
+    return (direction_angle(v2) - direction_angle(v1)) % (2 * math.pi)
 
 def angle(v1, v2):
-    x = np.array([v1[0], v1[1]])
-    y = np.array([v2[0], v2[1]])
-    cross = np.cross(x, y)
-    dot = np.dot(x, y)
-    x_length = np.sqrt((x * x).sum())
-    y_length = np.sqrt((y * y).sum())
-    _angle = np.arccos(dot / x_length / y_length) / math.pi * 180
-    return _angle
-
-def is_chord_free(_graph, _cycle):
-    angle_sum = 0
-    nodes = 0
-    for i in range(0, len(_cycle)):
-        current_angle = right_angle(_cycle[i - 1] - _cycle[i - 2], _cycle[i] - _cycle[i - 1])
-        angle_sum = angle_sum + current_angle
-        if current_angle > 0.01:
-            nodes = nodes + 1
-    inner_angle_sum = (nodes - 2) * math.pi
-    if angle_sum - 1 > inner_angle_sum:
-        bigger = True
-    else:
-        bigger = False
-
-    inner_angle_sum = inner_angle_sum * 180 / math.pi
-    angle_sum = angle_sum * 180 / math.pi
-    for i in range(1, len(_cycle) - 2):
-        angle_to_next_node = right_angle(_cycle[i - 1] - _cycle[i], _cycle[i + 1] - _cycle[i]) 
-        neighbors = _graph.neighbors(_cycle[i])
-        for n in neighbors:
-            if n != _cycle[i + 1] and n != _cycle[i - 1]:
-                angle_to_neighbor = right_angle(_cycle[i - 1] - _cycle[i], n - _cycle[i]) 
-                if angle_to_neighbor > angle_to_next_node and bigger == False:
-                    return False
-                if angle_to_neighbor < angle_to_next_node and bigger == True:
-                    return False
-    return True
-
-def planar_cycles(undirected_graph):
-
-    def next_neighbor(_path):
-        if len(_path) == 0:
-            return graph.edges()[0][0]
-        neighbors = graph.neighbors(_path[-1])    
-        if len(neighbors) == 0:
+    return math.degrees(math.atan2(abs(cross(v1, v2)), v1[0] * v2[0] + v1[1] * v2[1]))
+
+def cycle_key(cycle):
+    positions = [n.position() for n in cycle]
+    start = positions.index(min(positions))
+    forward = positions[start:] + positions[:start]
+    backward = forward[:1] + forward[:0:-1]
+    return tuple(min(forward, backward))
+
+def translation_key(graph):
+    nodes = graph.nodes()
+    if not nodes:
+        return ((), ()), {}
+    origin = (min([n[0] for n in nodes]), min([n[1] for n in nodes]))
+    # rounding hides the float noise that differs between translated copies
+    relative = dict((n, (round(n[0] - origin[0], 6), round(n[1] - origin[1], 6))) for n in nodes)
+    node_key = tuple(sorted([(relative[n], n.style(), n.fusable()) for n in nodes]))
+    edge_key = tuple(sorted([tuple(sorted([relative[u], relative[v]])) for u, v in graph.edges()]))
+    return (node_key, edge_key), relative
+
+def signed_area(cycle):
+    area = 0
+    for i in range(0, len(cycle)):
+        area = area + cycle[i - 1][0] * cycle[i][1] - cycle[i][0] * cycle[i - 1][1]
+    return area / 2.0
+
+def rectangle_bounds(cycle):
+    if len(cycle) < 5 or tuple(cycle[0]) != tuple(cycle[-1]):
+        return None
+    directions = []
+    for i in range(1, len(cycle)):
+        if cycle[i][1] == cycle[i - 1][1] and cycle[i][0] != cycle[i - 1][0]:
+            directions.append('horizontal')
+        elif cycle[i][0] == cycle[i - 1][0] and cycle[i][1] != cycle[i - 1][1]:
+            directions.append('vertical')
+        else:
             return None
+    turns = len([i for i in range(0, len(directions)) if directions[i] != directions[i - 1]])
+    if turns != 4:
+        return None
+    return ((min([n[0] for n in cycle]), min([n[1] for n in cycle])), (max([n[0] for n in cycle]), max([n[1] for n in cycle])))
+
+def rectangle_cycle(graph):
+    nodes = graph.nodes()
+    if len(nodes) < 4 or [n for n in nodes if graph.degree(n) != 2]:
+        return None
+    cycle = nodes[:1] + graph.neighbors(nodes[0])[:1]
+    while len(cycle) <= len(nodes) and cycle[-1] != cycle[0]:
+        neighbors = graph.neighbors(cycle[-1])
+        if neighbors[0] == cycle[-2]:
+            cycle.append(neighbors[1])
         else:
-            if len(_path) == 1:
-                return neighbors[0]
-            else:
-                if _path[-2] in neighbors:
-                    neighbors.remove(_path[-2])
-                if len(neighbors) == 0:
-                    return None
-                last_dir = _path[-2] - _path[-1]
-            rightmost_nb = min(neighbors, key=lambda x: right_angle(last_dir, x - _path[-1]))
-            return rightmost_nb 
-
-    def contains_cycle(_cycles, _cycle):
-        for c in _cycles:
-            not_equal = False
-            if len(c) == len(_cycle):
-                if _cycle[0] in c:
-                    start = c.index(_cycle[0])
-                    for i in range(0, len(c)):
-                        if c[start - i] != _cycle[i]:
-                            not_equal = True
-                    if not_equal == False:
-                        return True
-        return False
-                    
+            cycle.append(neighbors[0])
+    if len(cycle) != len(nodes) + 1 or rectangle_bounds(cycle) == None:
+        return None
+    # same orientation as the faces of planar_cycles
+    if signed_area(cycle) > 0:
+        cycle.reverse()
+    return cycle
+
+def ordered_neighbors(graph):
+    # neighbors of every node in counter clockwise order, starting at the x axis
+    positions = dict((node, fixed_point(node)) for node in graph.nodes())
+    angles = {}
+    neighbors = {}
+    neighbor_index = {}
+    for node in graph.nodes():
+        x, y = positions[node]
+        keys = {}
+        for n in graph.neighbors(node):
+            direction = (positions[n][0] - x, positions[n][1] - y)
+            if not direction in angles:
+                angles[direction] = fixed_direction_angle(direction)
+            keys[n] = angles[direction]
+        ordered = sorted(graph.neighbors(node), key = lambda n: keys[n])
+        neighbors[node] = ordered
+        neighbor_index[node] = dict((n, i) for i, n in enumerate(ordered))
+    return positions, neighbors, neighbor_index
+
+def face_walk(neighbors, neighbor_index, start, second, banned = frozenset()):
+    # the boundary of a face, taking the rightmost turn at every node
+    # and ignoring the banned edges
+    walk = []
+    previous, current = start, second
+    while True:
+        walk.append(current)
+        ordered = neighbors[current]
+        index = neighbor_index[current][previous]
+        following = ordered[(index + 1) % len(ordered)]
+        while banned and frozenset((current, following)) in banned:
+            index = index + 1
+            following = ordered[(index + 1) % len(ordered)]
+        previous, current = current, following
+        if previous == start and current == second:
+            return walk
+
+def face_cycles(walk, positions):
+    # split the walk at repeated nodes to cut off dangling paths and
+    # separate cycles that share a single node
     cycles = []
-    path = []
-    graph = undirected_graph.to_directed()
-    while graph.edges():
-        node = next_neighbor(path)
-        if node:
-            if node in path:
-                start = path[::-1].index(node)
-                start = len(path) - 1 - start
-                cycle = path[start:]
-                if not contains_cycle(cycles, cycle) and is_chord_free(graph, cycle):
-                    cycles.append(cycle)
-                graph.remove_edge(path[-1], node)
-                path = path[:start]    
-            else:
-                path.append(node)
-                if len(path) > 1:
-                    graph.remove_edge(path[-2], path[-1])
+    stack = []
+    stack_index = {}
+    for node in walk + walk[:1]:
+        if node in stack_index:
+            start = stack_index[node]
+            cycle = stack[start:]
+            for n in cycle[1:]:
+                del stack_index[n]
+            del stack[start + 1:]
+            # faces are walked clockwise, the outer boundaries counter clockwise
+            if len(cycle) > 2 and signed_area([positions[n] for n in cycle]) < 0:
+                cycles.append(cycle)
         else:
-            path.pop()
-            
+            stack_index[node] = len(stack)
+            stack.append(node)
+    return cycles
+
+def planar_cycles(graph):
+    positions, neighbors, neighbor_index = ordered_neighbors(graph)
+
+    # every half edge is on the boundary of exactly one face
+    visited = set()
+    cycles = []
+    keys = set()
+    for start in graph.nodes():
+        for second in neighbors[start]:
+            if (start, second) in visited:
+                continue
+            walk = face_walk(neighbors, neighbor_index, start, second)
+            for i in range(0, len(walk)):
+                visited.add((walk[i - 1], walk[i]))
+            for cycle in face_cycles(walk, positions):
+                key = cycle_key(cycle)
+                if not key in keys:
+                    keys.add(key)
+                    cycles.append(cycle)
+
     for c in cycles:
         c.append(c[0])
     
     return cycles
 
+def crossing_edges(graph):
+    # horizontal and vertical edges that cross each other without meeting
+    # in a node, like the lines of a crossover
+    edges = graph.edges()
+    horizontal = [start[1] == end[1] and start[0] != end[0] for start, end in edges]
+    vertical = [start[0] == end[0] and start[1] != end[1] for start, end in edges]
+    index = SpatialIndex(1)
+    for i, (start, end) in enumerate(edges):
+        if horizontal[i]:
+            index.insert(i, (min(start[0], end[0]), start[1]), (max(start[0], end[0]), start[1]))
+    pairs = []
+    for i, (start, end) in enumerate(edges):
+        if vertical[i]:
+            for j in index.query((start[0], min(start[1], end[1])), (start[0], max(start[1], end[1]))):
+                if not start in edges[j] and not end in edges[j]:
+                    pairs.append((i, j))
+    crossings = {}
+    if pairs:
+        segments = segment_array(edges)
+        pairs = np.array(pairs, dtype = int)
+        hits = line_segments_intersect_array(segments[pairs[:, 0]], segments[pairs[:, 1]])
+        for i, j in pairs[hits].tolist():
+            crossings.setdefault(frozenset(edges[i]), set()).add(frozenset(edges[j]))
+            crossings.setdefault(frozenset(edges[j]), set()).add(frozenset(edges[i]))
+    return crossings
+
+def crossing_cycles(graph, crossings):
+    # edges that cross are drawn on top of each other, so a face is a cycle
+    # that bounds a face of the graph without the edges crossing it
+    positions, neighbors, neighbor_index = ordered_neighbors(graph)
+
+    def layer_walk(start, second):
+        # the edges crossing an edge are left out as soon as it is walked
+        banned = set()
+        seen = set()
+        walk = []
+        previous, current = start, second
+        while not (previous, current) in seen:
+            seen.add((previous, current))
+            banned.update(crossings.get(frozenset((previous, current)), []))
+            walk.append(current)
+            ordered = neighbors[current]
+            index = neighbor_index[current][previous]
+            following = ordered[(index + 1) % len(ordered)]
+            while frozenset((current, following)) in banned:
+                index = index + 1
+                following = ordered[(index + 1) % len(ordered)]
+            previous, current = current, following
+            if previous == start and current == second:
+                return walk
+        return []
+
+    # the walks depend on the edge they start at, so every half edge that
+    # is not on a face yet is tried
+    covered = set()
+    cycles = []
+    keys = set()
+    for start in graph.nodes():
+        for second in neighbors[start]:
+            if (start, second) in covered:
+                continue
+            for cycle in face_cycles(layer_walk(start, second), positions):
+                key = cycle_key(cycle)
+                if key in keys:
+                    continue
+                edges = set([frozenset((cycle[i - 1], cycle[i])) for i in range(0, len(cycle))])
+                crossed = frozenset([other for edge in edges for other in crossings.get(edge, [])])
+                if crossed & edges:
+                    continue
+                face = face_walk(neighbors, neighbor_index, cycle[-1], cycle[0], crossed)
+                if [c for c in face_cycles(face, positions) if cycle_key(c) == key]:
+                    keys.add(key)
+                    cycles.append(cycle + cycle[:1])
+                    for i in range(0, len(cycle)):
+                        covered.add((cycle[i - 1], cycle[i]))
+    return cycles
+
+def break_cycles(graph, rank):
+    # inside a strongly connected component only the edges from higher to lower rank are kept
+    has_cycles = False
+    for component in nx.strongly_connected_components(graph):
+        members = set(component)
+        for node in members:
+            for successor in graph.successors(node):
+                if successor in members and rank[node] <= rank[successor]:
+                    graph.remove_edge(node, successor)
+                    has_cycles = True
+    return has_cycles
+
+def longest_path_layers(graph):
+    in_degree = dict((node, graph.in_degree(node)) for node in graph.nodes())
+    layers = dict((node, 0) for node in graph.nodes())
+    queue = collections.deque([node for node in graph.nodes() if in_degree[node] == 0])
+    while queue:
+        node = queue.popleft()
+        for successor in graph.successors(node):
+            layers[successor] = max(layers[successor], layers[node] + 1)
+            in_degree[successor] = in_degree[successor] - 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+    return layers
+
   
 def ccw(a, b, c):
-    return (c[1] - a[1]) * (b[0] - a[0]) > (b[1] - a[1]) * (c[0] - a[0])
+    return orientation(fixed_point(a), fixed_point(b), fixed_point(c)) > 0
 
 def line_segments_intersect(seg1, seg2):
-    return ccw(seg1[0], seg2[0], seg2[1]) != ccw(seg1[1], seg2[0], seg2[1]) and ccw(seg1[0], seg1[1], seg2[0]) != ccw(seg1[0], seg1[1], seg2[1])
+    a, b = fixed_point(seg1[0]), fixed_point(seg1[1])
+    c, d = fixed_point(seg2[0]), fixed_point(seg2[1])
+    return (orientation(a, c, d) > 0) != (orientation(b, c, d) > 0) and (orientation(a, b, c) > 0) != (orientation(a, b, d) > 0)
+
+def segment_array(segments):
+    return np.array([[tuple(segment[0]), tuple(segment[1])] for segment in segments], dtype = float).reshape((-1, 2, 2))
+
+def fixed_point_array(points):
+    # rounds half away from zero like fixed_point
+    points = np.asarray(points, dtype = float) * FIXED_POINT_SCALE
+    return (np.sign(points) * np.floor(np.abs(points) + 0.5)).astype(np.int64)
+
+def orientation_array(a, b, c):
+    return (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+
+def line_segments_intersect_array(segments1, segments2):
+    segments1 = fixed_point_array(segments1)
+    segments2 = fixed_point_array(segments2)
+    a, b = segments1[..., 0, :], segments1[..., 1, :]
+    c, d = segments2[..., 0, :], segments2[..., 1, :]
+    return ((orientation_array(a, c, d) > 0) != (orientation_array(b, c, d) > 0)) & ((orientation_array(a, b, c) > 0) != (orientation_array(a, b, d) > 0))
+
+def line_segment_point_distance_array(points, segments):
+    points = np.asarray(points, dtype = float)
+    segments = np.asarray(segments, dtype = float)
+    seg_start = segments[..., 0, :]
+    seg_end = segments[..., 1, :]
+    seg_dir = seg_end - seg_start
+    seg_length = (seg_dir * seg_dir).sum(axis = -1)
+    t = ((points - seg_start) * seg_dir).sum(axis = -1) / np.where(seg_length == 0, 1, seg_length)
+    t = np.where(seg_length == 0, 0, t)[..., np.newaxis]
+    projection = np.where(t < 0, seg_start, np.where(t > 1, seg_end, seg_start + t * seg_dir))
+    difference = points - projection
+    return np.sqrt((difference * difference).sum(axis = -1))
+
+def line_segments_distance_array(segments1, segments2):
+    segments1 = np.asarray(segments1, dtype = float)
+    segments2 = np.asarray(segments2, dtype = float)
+    distances = np.minimum(np.minimum(line_segment_point_distance_array(segments1[..., 0, :], segments2), line_segment_point_distance_array(segments1[..., 1, :], segments2)),
+                           np.minimum(line_segment_point_distance_array(segments2[..., 0, :], segments1), line_segment_point_distance_array(segments2[..., 1, :], segments1)))
+    return np.where(line_segments_intersect_array(segments1, segments2), 0, distances)
 
 def vector_length(v):
     return np.sqrt(v.dot(v))
@@ -163,9 +363,9 @@ def vector_length_squared(v):
     return v.dot(v)
 
 def line_segment_point_distance(point, seg):
-    seg_start = np.array(seg[0])
-    seg_end = np.array(seg[1])
-    point = np.array(point)
+    seg_start = np.array(seg[0], dtype = float)
+    seg_end = np.array(seg[1], dtype = float)
+    point = np.array(point, dtype = float)
     seg_dir = seg_end - seg_start
     seg_length = vector_length_squared(seg_dir)
     if seg_length == 0:
@@ -0,0 +1,176 @@
+class GridGraph(object):
+    def __init__(self, edges = [], nodes = []):
+        self.__ids = {}
+        self.__nodes = []
+        self.__adjacency = []
+        self.__annotations = {}
+        self.__size = 0
+        self.add_nodes_from(nodes)
+        self.add_edges_from(edges)
+        return
+
+    def __id(self, node):
+        try:
+            return self.__ids[node]
+        except KeyError:
+            index = len(self.__nodes)
+            self.__ids[node] = index
+            self.__nodes.append(node)
+            self.__adjacency.append([])
+            self.__size = self.__size + 1
+            return index
+
+    def __key(self, i, j):
+        if i < j:
+            return (i, j)
+        else:
+            return (j, i)
+
+    def add_node(self, node):
+        self.__id(node)
+        return
+
+    def add_nodes_from(self, nodes):
+        for node in nodes:
+            self.__id(node)
+        return
+
+    def add_edge(self, start, end, annotation = None):
+        i = self.__id(start)
+        j = self.__id(end)
+        if not j in self.__adjacency[i]:
+            self.__adjacency[i].append(j)
+            if i != j:
+                self.__adjacency[j].append(i)
+        if annotation:
+            key = self.__key(i, j)
+            merged = self.__annotations.get(key, {})
+            merged.update(annotation)
+            if [value for value in merged.values() if value != None]:
+                self.__annotations[key] = merged
+            elif key in self.__annotations:
+                del self.__annotations[key]
+        return
+
+    def add_edges_from(self, edges):
+        for edge in edges:
+            if len(edge) > 2:
+                self.add_edge(edge[0], edge[1], edge[2])
+            else:
+                self.add_edge(edge[0], edge[1])
+        return
+
+    def add_cycle(self, nodes):
+        for n in range(1, len(nodes)):
+            self.add_edge(nodes[n - 1], nodes[n])
+        if len(nodes) > 1:
+            self.add_edge(nodes[-1], nodes[0])
+        return
+
+    def update(self, graph):
+        self.add_nodes_from(graph.nodes())
+        self.add_edges_from(graph.edges(annotations = True))
+        return
+
+    def remove_edge(self, start, end):
+        i = self.__ids[start]
+        j = self.__ids[end]
+        self.__adjacency[i].remove(j)
+        if i != j:
+            self.__adjacency[j].remove(i)
+        self.__annotations.pop(self.__key(i, j), None)
+        return
+
+    def remove_node(self, node):
+        i = self.__ids.pop(node)
+        for j in self.__adjacency[i]:
+            if j != i:
+                self.__adjacency[j].remove(i)
+            self.__annotations.pop(self.__key(i, j), None)
+        self.__nodes[i] = None
+        self.__adjacency[i] = []
+        self.__size = self.__size - 1
+        return
+
+    def nodes(self):
+        return [node for node in self.__nodes if node is not None]
+
+    def edges(self, annotations = False):
+        edges = []
+        for i in range(0, len(self.__nodes)):
+            for j in self.__adjacency[i]:
+                if j >= i:
+                    if annotations:
+                        edges.append((self.__nodes[i], self.__nodes[j], self.__annotations.get((i, j), {})))
+                    else:
+                        edges.append((self.__nodes[i], self.__nodes[j]))
+        return edges
+
+    def annotation(self, start, end):
+        return self.__annotations.get(self.__key(self.__ids[start], self.__ids[end]), {})
+
+    def neighbors(self, node):
+        return [self.__nodes[j] for j in self.__adjacency[self.__ids[node]]]
+
+    def degree(self, node):
+        i = self.__ids[node]
+        return len(self.__adjacency[i]) + self.__adjacency[i].count(i)
+
+    def has_node(self, node):
+        return node in self.__ids
+
+    def has_edge(self, start, end):
+        if start in self.__ids and end in self.__ids:
+            return self.__ids[end] in self.__adjacency[self.__ids[start]]
+        return False
+
+    def number_of_nodes(self):
+        return self.__size
+
+    def number_of_edges(self):
+        return len(self.edges())
+
+    def copy(self):
+        return GridGraph(self.edges(annotations = True), self.nodes())
+
+    def relabel(self, mapping):
+        return GridGraph([(mapping[start], mapping[end], annotation) for start, end, annotation in self.edges(annotations = True)], [mapping[node] for node in self.nodes()])
+
+    def difference(self, graph):
+        return GridGraph([edge for edge in self.edges(annotations = True) if not graph.has_edge(edge[0], edge[1])])
+
+    def components(self):
+        parent = range(0, len(self.__nodes))
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(0, len(self.__nodes)):
+            for j in self.__adjacency[i]:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        components = {}
+        roots = []
+        for i in range(0, len(self.__nodes)):
+            if self.__nodes[i] is not None:
+                root = find(i)
+                if not root in components:
+                    components[root] = GridGraph()
+                    roots.append(root)
+                components[root].add_node(self.__nodes[i])
+        for start, end, annotation in self.edges(annotations = True):
+            components[find(self.__ids[start])].add_edge(start, end, annotation)
+        return [components[root] for root in roots]
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        return iter(self.nodes())
+
+    def __contains__(self, node):
+        return node in self.__ids
@@ -0,0 +1,43 @@
+from parser import Parser
+from charactergrid import CharacterGrid
+import re
+
+class GridLexer(Parser):
+    # quoted strings first, otherwise words and single characters except 'v'
+    TOKEN_PATTERN = re.compile('\'([^\']+)\'|(([\w]{2,})|([^\Wv]))', re.UNICODE)
+
+    def __init__(self):
+        super(GridLexer, self).__init__()
+        return
+
+    def run(self, raw_data, objects):
+        objects.append(self.lex(raw_data))
+        self._parsed_data = raw_data
+        self._objects = objects
+        return
+
+    def lex(self, raw_data):
+        texts = []
+        lines = []
+        line_number = 0
+        for line in raw_data:
+            quoted_texts = []
+            unquoted_texts = []
+            pieces = []
+            end = 0
+            for match in GridLexer.TOKEN_PATTERN.finditer(line):
+                span = match.span()
+                if match.group(1) != None:
+                    quoted_texts.append((match.group(1), (span[0] + 1, line_number)))
+                else:
+                    unquoted_texts.append((match.group(2), (span[0], line_number)))
+                pieces.append(line[end:span[0]])
+                pieces.append(' ' * (span[1] - span[0]))
+                end = span[1]
+            if pieces:
+                pieces.append(line[end:])
+                line = ''.join(pieces)
+            texts.extend(quoted_texts + unquoted_texts)
+            lines.append(line)
+            line_number = line_number + 1
+        return CharacterGrid(lines, texts)
@@ -3,8 +3,10 @@ from arrow import Arrow
 from polygon import Polygon
 
 class LeftArrow(Arrow):
+    GLYPH = [Node(0.5, 0.2), Node(-0.5, 0), Node(0.5, -0.2)]
+
     def __init__(self, position = (0, 0)):
-        Arrow.__init__(self, position, [Node(0.5, 0.2), Node(-0.5, 0), Node(0.5, -0.2)])
+        Arrow.__init__(self, position, LeftArrow.GLYPH)
 
     def tip(self):
         return Node(*(self.position())) + self.nodes()[1]
@@ -2,7 +2,10 @@ from parser import Parser
 from polygon import Polygon
 from opengraph import OpenGraph
 from text import Text
-from graphalgorithms import line_segments_distance
+from containmenttree import ContainmentTree
+from spatialindex import SpatialIndex
+from graphalgorithms import segment_array, line_segments_distance_array
+import numpy as np
 
 class NameParser(Parser):
     def __init__(self):
@@ -15,19 +18,36 @@ class NameParser(Parser):
         polygons = filter(lambda x: isinstance(x, Polygon), objects)
         graphs = filter(lambda x: isinstance(x, OpenGraph), objects)
         texts = filter(lambda x: isinstance(x, Text), objects)
+        containment_tree = ContainmentTree(polygons)
+        graph_edges = [graph.edges() for graph in graphs]
+        segments = segment_array([edge for edges in graph_edges for edge in edges])
+        owners = np.repeat(np.arange(len(graphs)), [len(edges) for edges in graph_edges])
+        bounds = zip(segments.min(axis = 1).tolist(), segments.max(axis = 1).tolist())
+        segment_index = SpatialIndex()
+        for i in range(0, len(segments)):
+            segment_index.insert(i, *bounds[i])
+        text_segments = segment_array([(text.letter_position(0), text.letter_position(len(text.text()) - 1)) for text in texts])
         
-        for text in texts:
+        candidates = []
+        for text, text_segment in zip(texts, text_segments.tolist()):
             text.add_name(text.text())
             position = (text.position()[0] + 0.5, text.position()[1] + 0.5)
-            polygons_containing_this_text = [polygon for polygon in polygons if polygon.contains(position)]
+            polygons_containing_this_text = containment_tree.containing(position)
             if polygons_containing_this_text:
                 polygon = max(polygons_containing_this_text,key = lambda p: p.z_order())
                 text.set_z_order(polygon.z_order() + 1)
                 polygon.add_name(text.text())
 
-            for graph in graphs:
-                for edge in graph.edges():
-                    if line_segments_distance((edge[0].position(), edge[1].position()), (text.letter_position(0), text.letter_position(len(text.text()) - 1))) <= 1:
-                        graph.add_name(text.text())
+            # only edges within the distance of 1 around the text can be near it
+            minimum = (min(text_segment[0][0], text_segment[1][0]) - 1, min(text_segment[0][1], text_segment[1][1]) - 1)
+            maximum = (max(text_segment[0][0], text_segment[1][0]) + 1, max(text_segment[0][1], text_segment[1][1]) + 1)
+            candidates.append(segment_index.query(minimum, maximum))
+
+        # all label and edge pairs are measured at once
+        queries = np.repeat(np.arange(len(texts)), [len(c) for c in candidates])
+        edges = np.array([i for c in candidates for i in c], dtype = int)
+        near = line_segments_distance_array(text_segments[queries], segments[edges]) <= 1
+        for text_index, graph_index in set(zip(queries[near].tolist(), owners[edges[near]].tolist())):
+            graphs[graph_index].add_name(texts[text_index].text())
 
         return
@@ -1,17 +1,28 @@
 import math
 
 class Node(object):
+    __slots__ = ('m_position', '__style', '__fusable', '__hash')
+
     def __init__(self, x, y, style = 'miter', fusable = True):
-        self.m_position = (x, y)
-        if style in ['miter', 'curve']:
-            self.__style = style
-        else:
+        if style != 'miter' and style != 'curve':
             raise ValueError
+        self.m_position = (x, y)
+        self.__style = style
         self.__fusable = fusable
+        self.__hash = hash(self.m_position)
         return
 
+    def __derive(self, x, y):
+        node = Node.__new__(Node)
+        node.m_position = (x, y)
+        node.__style = self.__style
+        node.__fusable = self.__fusable
+        node.__hash = hash(node.m_position)
+        return node
+
     def set_position(self, x, y):
         self.m_position = (x, y)
+        self.__hash = hash(self.m_position)
 
     def position(self):
         return self.m_position
@@ -25,35 +36,35 @@ class Node(object):
 
     def style(self):
         return self.__style
-    
+
     def __getitem__(self, index):
         if index == 0 or index == 1:
     		return self.m_position[index]
         raise IndexError
 
     def __add__(self, other):
-		return Node(self.m_position[0] + other[0], self.m_position[1] + other[1], self.style(), self.fusable())
+		return self.__derive(self.m_position[0] + other[0], self.m_position[1] + other[1])
 
     def __sub__(self, other):
-		return Node(self.m_position[0] - other[0], self.m_position[1] - other[1], self.style(), self.fusable())
+		return self.__derive(self.m_position[0] - other[0], self.m_position[1] - other[1])
 
     def __div__(self, other):
         if isinstance(other, (float, int)):
-            return Node(self.m_position[0] / other, self.m_position[1] / other, self.style(), self.fusable())
+            return self.__derive(self.m_position[0] / other, self.m_position[1] / other)
         else:
             raise NotImplementedError
 
     def __mul__(self, other):
         if isinstance(other, (float, int)):
-    		return Node(self.m_position[0] * other, self.m_position[1] * other, self.style(), self.fusable())
+    		return self.__derive(self.m_position[0] * other, self.m_position[1] * other)
         else:
-    		return Node(self.m_position[0] * other[0], self.m_position[1] * other[1], self.style(), self.fusable())
+    		return self.__derive(self.m_position[0] * other[0], self.m_position[1] * other[1])
 
     def __key__(self):
         return self.m_position
 
     def __hash__(self):
-        return hash(self.m_position)
+        return self.__hash
 
     def __cmp__(self, other):
         return cmp(self.m_position, other.m_position)
@@ -62,14 +73,22 @@ class Node(object):
         return "(" + str(self.m_position) + "," + self.style() + "," + str(self.fusable()) + ")"
 
     def __iter__(self):
-        return (n for n in self.m_position)
+        return iter(self.m_position)
+
+    def __getstate__(self):
+        return (self.m_position, self.__style, self.__fusable)
+
+    def __setstate__(self, state):
+        self.m_position, self.__style, self.__fusable = state
+        self.__hash = hash(self.m_position)
+        return
 
     def length(self):
-        return math.sqrt(sum(self.m_position[i]* self.m_position[i] for i in range(len(self.m_position))))
+        return math.sqrt(self.m_position[0] * self.m_position[0] + self.m_position[1] * self.m_position[1])
 
     def normalize(self):
         length = self.length()
         if length == 0:
             raise ArithmeticError
-        self.m_position = (self / length).m_position
+        self.set_position(self.m_position[0] / length, self.m_position[1] / length)
         return
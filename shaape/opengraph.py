@@ -2,33 +2,38 @@ from drawable import Drawable
 from edge import Edge
 from scalable import Scalable
 from operator import itemgetter
+import collections
 from named import Named
 from graphalgorithms import *
-import networkx as nx
-import copy
+from gridgraph import GridGraph
 
 class OpenGraph(Drawable, Scalable, Named):
-    def __init__(self, graph = nx.Graph()):
+    def __init__(self, graph = None):
         Drawable.__init__(self)
         Named.__init__(self)
         self.style().set_target_type('fill')
         self.add_name('_line_')
+        if graph == None:
+            graph = GridGraph()
+        elif not isinstance(graph, GridGraph):
+            graph = GridGraph(graph.edges(), graph.nodes())
         self.__graph = graph
-        self.__generate_paths()
+        self.__paths = None
         return
 
     def reduce_nodes(self):
-        node_reduced = True
-        while node_reduced == True:
-            node_reduced = False
-            for node in self.__graph.nodes():
-                if self.__graph.degree(node) == 2:
-                    neighbors = self.__graph.neighbors(node)
-                    if has_same_direction(neighbors[0] - node, node - neighbors[1]):
-                        self.__graph.add_edge(neighbors[0], neighbors[1])
-                        self.__graph.remove_node(node)
-                        node_reduced = True
-
+        if self.__paths == None:
+            self.__generate_paths()
+        pending = collections.deque(self.__graph.nodes())
+        while pending:
+            node = pending.popleft()
+            if self.__graph.has_node(node) and self.__graph.degree(node) == 2:
+                neighbors = self.__graph.neighbors(node)
+                if can_fuse(neighbors[0], node, neighbors[1]):
+                    self.__graph.add_edge(neighbors[0], neighbors[1])
+                    self.__graph.remove_node(node)
+                    pending.extend(neighbors)
+        return
 
     def graph(self):
         return self.__graph
@@ -44,10 +49,11 @@ class OpenGraph(Drawable, Scalable, Named):
         new_nodes = {}
         for node in old_nodes:
             new_nodes[node] = node * scale
-        self.__graph = nx.relabel_nodes(self.__graph, new_nodes)
-        for path in self.__paths:
-            for i in range(0, len(path)):
-                path[i] = path[i] * scale
+        self.__graph = self.__graph.relabel(new_nodes)
+        if self.__paths != None:
+            for path in self.__paths:
+                for i in range(0, len(path)):
+                    path[i] = path[i] * scale
         return
 
     def edges(self):
@@ -70,34 +76,49 @@ class OpenGraph(Drawable, Scalable, Named):
     
     def __generate_paths(self):
         self.__paths = []
-        graph = copy.deepcopy(self.__graph)
-        paths = []
+        graph = self.__graph
         if not graph.nodes():
             return
-        start_nodes = [n for n in graph.nodes() if (n.style() != 'curve' or (nx.degree(graph, n) == 1)) ]
+        visited = set()
+        cursors = {}
+        paths = []
+        start_nodes = [n for n in graph.nodes() if (n.style() != 'curve' or (graph.degree(n) == 1)) ]
+        # a path that starts inside a line would split it, so line ends and junctions come first
+        start_nodes = sorted(start_nodes, key = lambda n: (graph.degree(n) == 2, n.fusable()))
         if start_nodes:
             path = [start_nodes[0]]
         else:
             path = [graph.nodes()[0]]
 
+        def next_node(node):
+            if not node in cursors:
+                cursors[node] = [graph.neighbors(node), 0]
+            cursor = cursors[node]
+            neighbors = cursor[0]
+            while cursor[1] < len(neighbors) and frozenset([node, neighbors[cursor[1]]]) in visited:
+                cursor[1] = cursor[1] + 1
+            if cursor[1] < len(neighbors):
+                return neighbors[cursor[1]]
+            return None
+
         while path:
-            neighbors = nx.neighbors(graph, path[-1])
-            if neighbors:
-                node = neighbors[0]
-                graph.remove_edge(path[-1], node)
+            node = next_node(path[-1])
+            if node is not None:
+                visited.add(frozenset([path[-1], node]))
                 path.append(node)
             else:
-                paths.append(copy.copy(path))
-                while path and not graph.neighbors(path[-1]):
+                paths.append(list(path))
+                while path and next_node(path[-1]) is None:
                     path.pop()
-                
+
         for path in paths:
             self.__paths.append(reduce_path(path))
-        
-        return        
+        return
 
     def paths(self):
+        if self.__paths == None:
+            self.__generate_paths()
         return self.__paths
 
     def add_path(self, path):
-        self.__paths.append(path)
+        self.paths().append(path)
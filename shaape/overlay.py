@@ -1,57 +1,101 @@
-import networkx as nx
-import re
 from edge import Edge
 from node import Node
+from charactergrid import CharacterGrid
+from gridgraph import GridGraph
 
 class Overlay:
     def __init__(self, array = [], edges = []):
         self.__overlay = array
         self.__substitutes = edges
 
-    def substitutes(self, data):
-        graph = nx.Graph()
-        for data_y in range(0, len(data)):
-            for data_x in range(0, len(data[data_y])):
-                orig_x = data_x
-                orig_y = data_y
-                ov_y = 0
-                ov_x = 0
-                matched = True
-                while True == matched and ov_y < len(self.__overlay):
-                    if None != self.__overlay[ov_y][ov_x]:
-                        if not re.match(str(self.__overlay[ov_y][ov_x]), str(data[orig_y][orig_x]), re.UNICODE):
-                            matched = False
-                    if ov_x < len(self.__overlay[ov_y]) - 1:
-                        ov_x = ov_x + 1
-                        orig_x = orig_x + 1
-                        if orig_x >= len(data[orig_y]):
-                            matched = False
-                    else:
-                        ov_x = 0
-                        orig_x = data_x
-                        ov_y = ov_y + 1
-                        orig_y = orig_y + 1
-                        if orig_y >= len(data) and ov_y < len(self.__overlay):
-                            matched = False
-                if True == matched:
-                    for obj in self.__substitutes:
-                        if isinstance(obj, Edge):
-                            edge = obj
-                            start = edge.start() + (data_x, data_y)
-                            end = edge.end() + (data_x, data_y)
-                            _above = None
-                            _below = None
-                            z_order = None
-                            if edge.above() != None:
-                                above_start = edge.above().start() + (data_x, data_y)
-                                above_end = edge.above().end() + (data_x, data_y)
-                                _above =  Edge(above_start, above_end)
-                            if edge.below() != None:
-                                below_start = edge.below().start() + (data_x, data_y)
-                                below_end = edge.below().end() + (data_x, data_y)
-                                _below = Edge(below_start, below_end)
-                            graph.add_edge(start, end, above = _above, below = _below, z_order = edge.z_order())
-                        elif isinstance(obj, Node):
-                            start = obj + (data_x, data_y)
-                            graph.add_node(start)
+    def height(self):
+        return len(self.__overlay)
+
+    def matches(self, grid):
+        grid_width, grid_height = grid.size()
+        height = len(self.__overlay)
+        width = max([len(row) for row in self.__overlay] + [0])
+        if height == 0 or width == 0 or height > grid_height or width > grid_width:
+            return []
+        cells = []
+        for ov_y in range(0, height):
+            for ov_x in range(0, width):
+                if ov_x < len(self.__overlay[ov_y]):
+                    cells.append((ov_x, ov_y, self.__overlay[ov_y][ov_x]))
+                else:
+                    cells.append((ov_x, ov_y, None))
+
+        # only the cells matching the rarest pattern can start a match
+        anchor = min(cells, key = lambda cell: grid.count(cell[2]))
+        xs, ys = grid.positions(anchor[2])
+        xs = xs - anchor[0]
+        ys = ys - anchor[1]
+        matched = (xs >= 0) & (ys >= 0) & (xs <= grid_width - width) & (ys <= grid_height - height)
+        xs = xs[matched]
+        ys = ys[matched]
+        for ov_x, ov_y, pattern in cells:
+            if (ov_x, ov_y) != anchor[:2]:
+                matched = grid.matches(pattern, xs + ov_x, ys + ov_y)
+                xs = xs[matched]
+                ys = ys[matched]
+        return zip(xs.tolist(), ys.tolist())
+
+    def step(self):
+        if len(self.__overlay) != 1 or len(self.__overlay[0]) != 1 or len(self.__substitutes) != 1:
+            return None
+        edge = self.__substitutes[0]
+        if not isinstance(edge, Edge) or edge.above() != None or edge.below() != None or edge.z_order() != None:
+            return None
+        step = (edge.end()[0] - edge.start()[0], edge.end()[1] - edge.start()[1])
+        if step == (0, 0) or step[0] != int(step[0]) or step[1] != int(step[1]):
+            return None
+        return (int(step[0]), int(step[1]))
+
+    def runs(self, data, matches = None):
+        if matches == None:
+            if not isinstance(data, CharacterGrid):
+                data = CharacterGrid(data)
+            matches = self.matches(data)
+        step = self.step()
+        matched = set(matches)
+        runs = []
+        for data_x, data_y in matches:
+            if not (data_x - step[0], data_y - step[1]) in matched:
+                run = [(data_x, data_y)]
+                while (run[-1][0] + step[0], run[-1][1] + step[1]) in matched:
+                    run.append((run[-1][0] + step[0], run[-1][1] + step[1]))
+                runs.append(run)
+        edge = self.__substitutes[0]
+        return [[edge.start() + position for position in run] + [edge.end() + run[-1]] for run in runs]
+
+    def substitutes(self, data, graph = None, matches = None):
+        if matches == None:
+            if not isinstance(data, CharacterGrid):
+                data = CharacterGrid(data)
+            matches = self.matches(data)
+        if graph == None:
+            graph = GridGraph()
+        edges = []
+        nodes = []
+        for data_x, data_y in matches:
+            for obj in self.__substitutes:
+                if isinstance(obj, Edge):
+                    edge = obj
+                    start = edge.start() + (data_x, data_y)
+                    end = edge.end() + (data_x, data_y)
+                    _above = None
+                    _below = None
+                    if edge.above() != None:
+                        above_start = edge.above().start() + (data_x, data_y)
+                        above_end = edge.above().end() + (data_x, data_y)
+                        _above =  Edge(above_start, above_end)
+                    if edge.below() != None:
+                        below_start = edge.below().start() + (data_x, data_y)
+                        below_end = edge.below().end() + (data_x, data_y)
+                        _below = Edge(below_start, below_end)
+                    edges.append((start, end, {'above' : _above, 'below' : _below, 'z_order' : edge.z_order()}))
+                elif isinstance(obj, Node):
+                    nodes.append(obj + (data_x, data_y))
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edges)
         return graph
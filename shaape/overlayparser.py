@@ -2,21 +2,56 @@ import networkx as nx
 import warnings
 import operator
 import math
+import multiprocessing
 from opengraph import OpenGraph
 from polygon import Polygon
 from parser import *
 from node import *
 from edge import Edge
 from overlay import Overlay
-from graphalgorithms import planar_cycles
+from charactergrid import CharacterGrid
+from gridgraph import GridGraph
+from containmenttree import ContainmentTree
+from edgeindex import EdgeIndex
+from graphalgorithms import translation_key, rectangle_cycle, planar_cycles, crossing_edges, crossing_cycles, break_cycles, longest_path_layers
+
+def decompose_shape(shape):
+    positions, edges = shape
+    component = GridGraph([(Node(*u), Node(*v)) for u, v in edges], [Node(*p) for p in positions])
+    minimum_cycles = rectangle_cycle(component)
+    if minimum_cycles != None:
+        minimum_cycles = [minimum_cycles]
+    else:
+        crossings = crossing_edges(component)
+        if crossings:
+            minimum_cycles = crossing_cycles(component, crossings)
+        else:
+            minimum_cycles = planar_cycles(component)
+
+    path_graph = GridGraph()
+    for cycle in minimum_cycles:
+        path_graph.add_cycle(cycle)
+    remaining_graph = component.difference(path_graph)
+    remaining_components = []
+    if len(remaining_graph.edges()) > 0:
+        remaining_components = remaining_graph.components()
+    return ([[n.position() for n in cycle] for cycle in minimum_cycles], [([n.position() for n in c.nodes()], [(u.position(), v.position()) for u, v in c.edges()]) for c in remaining_components])
+
+def match_band(band):
+    overlays, lines, offset, rows = band
+    grid = CharacterGrid(lines)
+    return [[(x, y + offset) for x, y in overlay.matches(grid) if y < rows] for overlay in overlays]
 
 class OverlayParser(Parser):
 
     CROSSING_LENGTH = 0.5
     CROSSING_HEIGHT = 0.25
+    PARALLEL_EDGES = 64
+    BAND_ROWS = 256
 
-    def __init__(self):
+    def __init__(self, jobs = 1):
         super(OverlayParser, self).__init__()
+        self.__jobs = jobs
         self.__sub_overlays = []
         self.__sub_overlays.append(Overlay([['\+']], [Node(0.5, 0.5)]))
         self.__sub_overlays.append(Overlay([['-']], [Edge(Node(0, 0.5), Node(1, 0.5))]))
@@ -103,102 +138,154 @@ class OverlayParser(Parser):
             length = length + (cycle[i + 1] - cycle[i]).length()
         return length
 
+    def __match(self, grid):
+        width, height = grid.size()
+        if self.__jobs < 2 or height < 2 * OverlayParser.BAND_ROWS:
+            return dict((overlay, overlay.matches(grid)) for overlay in self.__sub_overlays)
+
+        # every band owns the matches starting in its rows and also sees
+        # the rows below it that its tallest overlay can reach
+        overlap = max([overlay.height() for overlay in self.__sub_overlays]) - 1
+        rows = max(OverlayParser.BAND_ROWS, -(-height // self.__jobs))
+        lines = grid.lines()
+        bands = [(self.__sub_overlays, lines[y:y + rows + overlap], y, rows) for y in range(0, height, rows)]
+        pool = multiprocessing.Pool(min(self.__jobs, len(bands)))
+        try:
+            results = pool.map(match_band, bands)
+        finally:
+            pool.close()
+            pool.join()
+        matches = dict((overlay, []) for overlay in self.__sub_overlays)
+        for band_matches in results:
+            for overlay, overlay_matches in zip(self.__sub_overlays, band_matches):
+                matches[overlay] += overlay_matches
+        return matches
+
+    def __substitute_lines(self, grid, graph, overlays, matches):
+        runs = []
+        for overlay in overlays:
+            runs += overlay.runs(grid, matches[overlay])
+
+        # a run is only split where something else connects to it
+        junctions = set(graph.nodes())
+        for start, end, annotation in graph.edges(annotations = True):
+            for edge in annotation.values():
+                if isinstance(edge, Edge):
+                    junctions.update([edge.start(), edge.end()])
+        touched = set()
+        for run in runs:
+            for node in run:
+                if node in touched:
+                    junctions.add(node)
+                else:
+                    touched.add(node)
+
+        for run in runs:
+            start = run[0]
+            for i in range(1, len(run)):
+                node = run[i]
+                if node in junctions or i == len(run) - 1:
+                    graph.add_edge(start, node)
+                    start = node
+        return
+
     def run(self, raw_data, objects):
-        graphs = []
         new_objects = []
-        for overlay in self.__sub_overlays:
-            g = overlay.substitutes(raw_data)
-            graphs.append(g)
+        grid = next((obj for obj in objects if isinstance(obj, CharacterGrid)), None)
+        if grid == None:
+            grid = CharacterGrid(raw_data)
+        matches = self.__match(grid)
 
-        graph = graphs.pop(0)
-        for h in graphs:
-            graph = nx.compose(graph, h)
+        # later overlays refine the nodes of earlier ones, so they go in first
+        graph = GridGraph()
+        line_overlays = [overlay for overlay in self.__sub_overlays if overlay.step() != None]
+        for overlay in reversed(self.__sub_overlays):
+            if not overlay in line_overlays:
+                overlay.substitutes(grid, graph, matches[overlay])
+        self.__substitute_lines(grid, graph, reversed(line_overlays), matches)
 
-        components = nx.connected_component_subgraphs(graph)
+        components = graph.components()
         closed_polygons = []
         polygons = []
+        shapes = {}
+        translations = []
+        pending = []
         for component in components:
-            minimum_cycles = planar_cycles(component)
+            # copies of a shape only differ by a translation, they share one result
+            key, relative = translation_key(component)
+            translations.append((key, relative))
+            if not key in shapes:
+                shapes[key] = None
+                pending.append((key, ([relative[n] for n in component.nodes()], [(relative[u], relative[v]) for u, v in component.edges()])))
+
+        large = [(key, shape) for key, shape in pending if len(shape[1]) >= OverlayParser.PARALLEL_EDGES]
+        if self.__jobs > 1 and len(large) > 1:
+            pool = multiprocessing.Pool(min(self.__jobs, len(large)))
+            try:
+                results = pool.map(decompose_shape, [shape for key, shape in large])
+            finally:
+                pool.close()
+                pool.join()
+            for (key, shape), result in zip(large, results):
+                shapes[key] = result
+        for key, shape in pending:
+            if shapes[key] == None:
+                shapes[key] = decompose_shape(shape)
+
+        for key, relative in translations:
+            nodes = dict((position, n) for n, position in relative.items())
+            cycles, remaining = shapes[key]
+            minimum_cycles = [[nodes[position] for position in cycle] for cycle in cycles]
 
             # the polygons are the same as the minimum cycles
             closed_polygons += minimum_cycles
-            path_graph = nx.Graph()
-            path_graph.add_nodes_from(component.nodes())
-
             for polygon in minimum_cycles:
                 polygons.append(Polygon(polygon))
-                path_graph.add_cycle(polygon)
 
-            remaining_graph = nx.difference(component, path_graph)
-            for n in remaining_graph.nodes():
-                if remaining_graph.degree(n) == 0:
-                    remaining_graph.remove_node(n)
-            if len(remaining_graph.edges()) > 0:
-                remaining_components = nx.connected_component_subgraphs(remaining_graph)
-                for c in remaining_components:
-                    new_objects.append(OpenGraph(c))
+            for graph_nodes, graph_edges in remaining:
+                new_objects.append(OpenGraph(GridGraph([(nodes[u], nodes[v]) for u, v in graph_edges], [nodes[n] for n in graph_nodes])))
 
-        
         new_objects = new_objects + polygons
         z_order_graph = nx.DiGraph()
         z_order_graph.add_nodes_from(new_objects)
         
-        for i in range(0, len(polygons)):
-            polygon1 = polygons[i]
-            for j in range(i + 1, len(polygons)):
-                polygon2 = polygons[j]
-                if polygon1 != polygon2:
-                    if polygon1.contains(polygon2):
-                        z_order_graph.add_edge(polygon1, polygon2)
-                    elif polygon2.contains(polygon1):
-                        z_order_graph.add_edge(polygon2, polygon1)
+        z_order_graph.add_edges_from(ContainmentTree(polygons).edges())
             
        
-        for obj in new_objects:
-            for edge in obj.edges():
-                if 'below' in graph[edge[0]][edge[1]]:
-                    below = graph[edge[0]][edge[1]]['below']
-                    if below != None:
-                        for obj_above in new_objects:
-                            if obj != obj_above:
-                                if obj_above.has_edge(below.start(), below.end()):
-                                    z_order_graph.add_edge(obj, obj_above)
-                if 'above' in graph[edge[0]][edge[1]]:
-                    above = graph[edge[0]][edge[1]]['above']
-                    if above != None:
-                        for obj_below in new_objects:
-                            if obj != obj_below:
-                                if obj_below.has_edge(above.start(), above.end()):
-                                    z_order_graph.add_edge(obj_below, obj)
-                if 'z_order' in graph[edge[0]][edge[1]]:
-                    z_order = graph[edge[0]][edge[1]]['z_order']
-                    if z_order != None:
-                        for other_obj in new_objects:
-                            if obj != other_obj:
-                                if (isinstance(other_obj, Polygon) and other_obj.frame().intersects(edge)) or (isinstance(other_obj, OpenGraph) and other_obj.intersects(edge)):
-                                    if z_order == 'above':
-                                        z_order_graph.add_edge(other_obj, obj)
-                                    elif z_order == 'below':
-                                        z_order_graph.add_edge(obj, other_obj)
-                                    else:
-                                        raise ValueError, "Wrong value for z_order."
-
-        cycles = nx.simple_cycles(z_order_graph)
-        if cycles:
+        edge_index = EdgeIndex(new_objects)
+        annotated_edges = [(obj, edge, graph.annotation(edge[0], edge[1])) for obj in new_objects for edge in obj.edges()]
+        crossings = iter(edge_index.crossings([edge for obj, edge, annotation in annotated_edges if annotation.get('z_order') != None]))
+        for obj, edge, annotation in annotated_edges:
+            if 'below' in annotation:
+                below = annotation['below']
+                if below != None:
+                    for obj_above in edge_index.owners(below.start(), below.end()):
+                        if obj != obj_above:
+                            z_order_graph.add_edge(obj, obj_above)
+            if 'above' in annotation:
+                above = annotation['above']
+                if above != None:
+                    for obj_below in edge_index.owners(above.start(), above.end()):
+                        if obj != obj_below:
+                            z_order_graph.add_edge(obj_below, obj)
+            if 'z_order' in annotation:
+                z_order = annotation['z_order']
+                if z_order != None:
+                    for other_obj in next(crossings):
+                        if obj != other_obj:
+                            if z_order == 'above':
+                                z_order_graph.add_edge(other_obj, obj)
+                            elif z_order == 'below':
+                                z_order_graph.add_edge(obj, other_obj)
+                            else:
+                                raise ValueError, "Wrong value for z_order."
+
+        rank = dict((obj, i) for i, obj in enumerate(new_objects))
+        if break_cycles(z_order_graph, rank):
             warnings.warn("The diagram contains objects. that have an ambiguous z-order. Shaape estimates their z-order.", RuntimeWarning)
-        for cycle in cycles:
-            cycle_edges = [(cycle[i], cycle[i + 1]) for i in range(0, len(cycle) - 1)]
-            for edge in cycle_edges:
-                z_order_graph.remove_edge(edge[0], edge[1])
-                       
-
-        current_z_order = 0
-        while z_order_graph.nodes():
-            nodes_without_predecessors = [node for node in z_order_graph.nodes() if not z_order_graph.predecessors(node)]
-            for node in nodes_without_predecessors:
-                node.set_z_order(current_z_order)
-            current_z_order = current_z_order + 1
-            z_order_graph.remove_nodes_from(nodes_without_predecessors)
+
+        for node, depth in longest_path_layers(z_order_graph).items():
+            node.set_z_order(depth)
 
         for o in new_objects:
             if type(o) == Polygon or type(o) == OpenGraph:
@@ -2,33 +2,44 @@ from drawable import Drawable
 from edge import Edge
 from named import Named
 from scalable import Scalable
-import networkx as nx
 from opengraph import OpenGraph
+from node import Node
+from gridgraph import GridGraph
 from graphalgorithms import *
+import numpy as np
 
 class Polygon(Drawable, Named, Scalable):
     def __init__(self, node_list):
         Drawable.__init__(self)
         Named.__init__(self)
         self.__node_list = node_list 
-        cycle_graph = nx.Graph()
-        if node_list :
-            for n in range(1, len(node_list)):
-                cycle_graph.add_edge(node_list[n - 1], node_list[n])
+        self.__update_geometry()
+        self.__frame_nodes = list(node_list)
+        self.__frame = None
         self.style().set_target_type('fill')
-        self.__frame = OpenGraph(cycle_graph)
-        self.__frame.style().set_target_type('frame')
+        return
+
+    def __update_geometry(self):
+        self.__points = np.array([node.position() for node in self.__node_list]).reshape((len(self.__node_list), 2))
+        if len(self.__node_list) > 0:
+            self.__min = tuple(self.__points.min(axis = 0).tolist())
+            self.__max = tuple(self.__points.max(axis = 0).tolist())
+        else:
+            self.__min = None
+            self.__max = None
+        self.__edge_set = set([frozenset([tuple(start), tuple(end)]) for start, end in self.edges()])
+        self.__rectangle = rectangle_bounds(self.__node_list)
         return
 
     def reduce_nodes(self):
         self.__node_list = reduce_path(self.__node_list)
+        self.__update_geometry()
 
     def contains(self, obj):
         if type(obj) == Polygon:
             # check if all nodes are inside
-            for p in obj.nodes():
-                if not self.contains(p):
-                    return False
+            if not self.contains_points(obj.points()).all():
+                return False
 
             # check for edge intersections
             outer_edges = [Edge(self.nodes()[i], self.nodes()[i + 1]) for i in range(0, len(self.nodes()) - 1)]
@@ -38,6 +49,9 @@ class Polygon(Drawable, Named, Scalable):
                     if inner_edge.intersects(outer_edge):
                         return False
             return True
+        elif self.__rectangle != None:
+            minimum, maximum = self.__rectangle
+            return minimum[0] < obj[0] <= maximum[0] and minimum[1] < obj[1] <= maximum[1]
         else:
             n = len(self.__node_list)
             inside = False
@@ -48,39 +62,68 @@ class Polygon(Drawable, Named, Scalable):
                 if y > min(p1y,p2y):
                     if y <= max(p1y,p2y):
                         if x <= max(p1x,p2x):
-                            xinters = (y-p1y)*(p2x-p1x)/(p2y-p1y)+p1x
+                            xinters = float(y-p1y)*(p2x-p1x)/(p2y-p1y)+p1x
                             if p1x == p2x or x <= xinters:
                                 inside = not inside
                 p1x,p1y = p2x,p2y
             return inside
 
+    def contains_points(self, points):
+        points = np.asarray(points, dtype = float).reshape((-1, 2))
+        x = points[:, 0:1]
+        y = points[:, 1:2]
+        if self.__rectangle != None:
+            minimum, maximum = self.__rectangle
+            return ((minimum[0] < x) & (x <= maximum[0]) & (minimum[1] < y) & (y <= maximum[1]))[:, 0]
+        if len(self.__node_list) == 0:
+            return np.zeros(len(points), dtype = bool)
+        # one row per point, one column per edge of the ray casting loop in contains
+        vertices = self.__points.astype(float)
+        p1 = vertices[np.concatenate(([0], np.arange(0, len(vertices))))]
+        p2 = vertices[np.arange(0, len(vertices) + 1) % len(vertices)]
+        p1x, p1y, p2x, p2y = p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1]
+        dy = np.where(p2y == p1y, 1, p2y - p1y)
+        xinters = (y - p1y) * (p2x - p1x) / dy + p1x
+        crossings = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y)) & (x <= np.maximum(p1x, p2x)) & ((p1x == p2x) | (x <= xinters))
+        return crossings.sum(axis = 1) % 2 == 1
+
     def nodes(self):
         return self.__node_list
 
+    def points(self):
+        return self.__points
+
     def edges(self):
         return [(self.__node_list[i], self.__node_list[i + 1]) for i in range(0, len(self.__node_list) - 1)] 
 
     def has_edge(self, start, end):
-        i = 0
-        while True:
-            try:
-                i = self.__node_list.index(start, i + 1)
-                if self.__node_list[i - 1] == end or (i < len(self.__node_list) - 1 and self.__node_list[i + 1] == end):
-                    return True
-            except ValueError:
-                return False
+        return frozenset([tuple(start), tuple(end)]) in self.__edge_set
 
     def max(self):
-        return (max([n[0] for n in self.__node_list]), max([n[1] for n in self.__node_list]))
+        return self.__max
 
     def min(self):
-        return (min([n[0] for n in self.__node_list]), min([n[1] for n in self.__node_list]))
+        return self.__min
 
     def scale(self, scale):
-        for n in range(0, len(self.__node_list)):
-            node = self.__node_list[n]
-            self.__node_list[n] = node * scale
-        self.__frame.scale(scale)
+        if isinstance(scale, (float, int)):
+            scale = (scale, scale)
+        points = self.__points * np.array(scale)
+        self.__node_list = [Node(point[0], point[1], node.style(), node.fusable()) for node, point in zip(self.__node_list, points.tolist())]
+        self.__update_geometry()
+        if self.__frame != None:
+            self.__frame.scale(scale)
+        else:
+            self.__frame_nodes = [node * scale for node in self.__frame_nodes]
+
+    def has_frame(self):
+        return self.__frame != None
 
     def frame(self):
+        if self.__frame == None:
+            cycle_graph = GridGraph()
+            for n in range(1, len(self.__frame_nodes)):
+                cycle_graph.add_edge(self.__frame_nodes[n - 1], self.__frame_nodes[n])
+            self.__frame = OpenGraph(cycle_graph)
+            self.__frame.style().set_target_type('frame')
         return self.__frame
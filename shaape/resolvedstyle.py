@@ -0,0 +1,44 @@
+class ResolvedStyle(object):
+    __slots__ = ('__name_pattern', '__target_type', '__priority', '__color', '__fill_type', '__shadow', '__width', '__font', '__key')
+
+    def __init__(self, style):
+        self.__name_pattern = style.name_pattern()
+        self.__target_type = style.target_type()
+        self.__priority = style.priority()
+        self.__color = style.color()
+        self.__fill_type = style.fill_type()
+        self.__shadow = style.shadow()
+        self.__width = style.width()
+        self.__font = style.font()
+        self.__key = (self.__target_type, self.__priority, tuple([tuple(color) for color in self.__color]), self.__fill_type, self.__shadow, self.__width, self.__font.name())
+        return
+
+    def key(self):
+        return self.__key
+
+    def name_pattern(self):
+        return self.__name_pattern
+
+    def target_type(self):
+        return self.__target_type
+
+    def priority(self):
+        return self.__priority
+
+    def color(self):
+        return self.__color
+
+    def fill_type(self):
+        return self.__fill_type
+
+    def shadow(self):
+        return self.__shadow
+
+    def width(self):
+        return self.__width
+
+    def font(self):
+        return self.__font
+
+    def __repr__(self):
+        return "(target_type:" + self.__target_type + ", color:" + str(self.__color) + ", type:" + self.__fill_type + ", shadow:" + self.__shadow + ", width:" + str(self.__width) + ", font:" + self.__font.name() + ", prio:" + str(self.__priority) + ")"
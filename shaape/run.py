@@ -4,6 +4,7 @@ from nameparser import NameParser
 from styleparser import StyleParser
 from yamlparser import YamlParser
 from overlayparser import OverlayParser
+from gridlexer import GridLexer
 from textparser import TextParser
 from arrowparser import ArrowParser
 from backgroundparser import BackgroundParser
@@ -22,7 +23,7 @@ import os
 import codecs
 
 class Shaape:
-    def __init__(self, source = '-', output_file = "", enable_hashing = False, output_type = "png", scale = 1.0, width = None, height = None):
+    def __init__(self, source = '-', output_file = "", enable_hashing = False, output_type = "png", scale = 1.0, width = None, height = None, jobs = 1):
         if source == '-':
             source = codecs.getreader('utf-8')(sys.stdin).readlines()
         else:
@@ -40,8 +41,9 @@ class Shaape:
         if not enable_hashing or not hash_check(source + [self.__additional_source], output_file + ".md5"):
             self.register_parser(YamlParser())
             self.register_parser(BackgroundParser())
+            self.register_parser(GridLexer())
             self.register_parser(TextParser())
-            self.register_parser(OverlayParser())
+            self.register_parser(OverlayParser(jobs = jobs))
             self.register_parser(ArrowParser())
             self.register_parser(NameParser())
             self.register_parser(StyleParser())
@@ -116,11 +118,12 @@ def run(arguments = None):
     parser.add_argument('-s', '--scale', type=float, help='scale factor of the resulting image', default = '1.0')
     parser.add_argument('--width', type=float, help='width of the resulting image in pixels')
     parser.add_argument('--height', type=float, help='height of the resulting image in pixels')
+    parser.add_argument('-j', '--jobs', type=int, help='number of processes used to find the shapes of large diagrams', default = 1)
 
     args = parser.parse_args(arguments)
     if None == args.outfile:
         args.outfile = args.infile + "." + args.output_type
-    shaape = Shaape(args.infile, args.outfile, enable_hashing = args.do_hash, output_type = args.output_type, scale = args.scale, width = args.width, height = args.height)
+    shaape = Shaape(args.infile, args.outfile, enable_hashing = args.do_hash, output_type = args.output_type, scale = args.scale, width = args.width, height = args.height, jobs = args.jobs)
     shaape.run()
     print(" ")
 
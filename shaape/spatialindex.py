@@ -0,0 +1,42 @@
+import math
+
+class SpatialIndex(object):
+    DEFAULT_CELL_SIZE = 8
+
+    def __init__(self, cell_size = DEFAULT_CELL_SIZE):
+        self.__cell_size = float(cell_size)
+        self.__cells = {}
+        self.__items = []
+        return
+
+    def __cell_range(self, minimum, maximum):
+        x_range = range(int(math.floor(minimum[0] / self.__cell_size)), int(math.floor(maximum[0] / self.__cell_size)) + 1)
+        y_range = range(int(math.floor(minimum[1] / self.__cell_size)), int(math.floor(maximum[1] / self.__cell_size)) + 1)
+        return [(x, y) for x in x_range for y in y_range]
+
+    def cell_size(self):
+        return self.__cell_size
+
+    def insert(self, item, minimum, maximum = None):
+        if maximum == None:
+            maximum = minimum
+        index = len(self.__items)
+        self.__items.append(item)
+        for cell in self.__cell_range(minimum, maximum):
+            if cell in self.__cells:
+                self.__cells[cell].append(index)
+            else:
+                self.__cells[cell] = [index]
+        return
+
+    def query(self, minimum, maximum = None):
+        if maximum == None:
+            maximum = minimum
+        indices = set()
+        for cell in self.__cell_range(minimum, maximum):
+            if cell in self.__cells:
+                indices.update(self.__cells[cell])
+        return [self.__items[i] for i in sorted(indices)]
+
+    def __len__(self):
+        return len(self.__items)
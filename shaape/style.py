@@ -54,6 +54,9 @@ class Style(object):
                 if self.__target_type == 'text':
                     self.font().set_name(option)
 
+    def __option(self, key):
+        return self.__options.get(key, Style.DEFAULT_STYLE[key])
+
     def merge(self, style):
         self.__options = dict(self.__options.items() + style.options().items())
         self.__priority = style.priority()
@@ -69,7 +72,7 @@ class Style(object):
         self.__name_pattern = name_pattern
 
     def shadow(self):
-        return  dict(Style.DEFAULT_STYLE.items() + self.__options.items())['shadow']
+        return self.__option('shadow')
 
     def set_target_type(self, target_type):
         self.__target_type = target_type
@@ -78,16 +81,16 @@ class Style(object):
         return
 
     def color(self):
-        return dict(Style.DEFAULT_STYLE.items() + self.__options.items())['color']
+        return self.__option('color')
 
     def fill_type(self):
-        return dict(Style.DEFAULT_STYLE.items() + self.__options.items())['type']
+        return self.__option('type')
 
     def font(self):
-        return dict(Style.DEFAULT_STYLE.items() + self.__options.items())['font']
+        return self.__option('font')
 
     def width(self):
-        return dict(Style.DEFAULT_STYLE.items() + self.__options.items())['width']
+        return self.__option('width')
 
     def add_color(self, color):
         if len(color) == 3 or len(color) == 4:
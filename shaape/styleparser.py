@@ -7,8 +7,11 @@ from polygon import Polygon
 from opengraph import OpenGraph
 from style import Style
 import re
+import bisect
 
 class StyleParser(Parser):
+    SPECIAL_CHARACTERS = '.^$*+?{}[]\\|()'
+
     def __init__(self):
         super(StyleParser, self).__init__()
         return
@@ -37,23 +40,63 @@ class StyleParser(Parser):
                 elif isinstance(obj, Text):
                     obj.set_style(default_style['text'])
 
+        # objects by name, so that every pattern is matched against each distinct name only once
+        named_objects = {}
+        for obj in named_drawables:
+            for name in obj.names():
+                named_objects.setdefault(name, []).append(obj)
+        names = sorted(named_objects.keys())
+        matched_names = {}
+
+        # styles of each target in the order they apply
+        target_styles = {}
+        targets = []
         for style in styles:
-            name_pattern = re.compile(style.name_pattern(), re.UNICODE)
-            for obj in named_drawables:
-                for name in obj.names():
-                    if name_pattern.match(name):
-                        if style.target_type() == 'frame' and isinstance(obj, Polygon):
-                            target_obj = obj.frame()
-                        elif style.target_type() == 'text' and isinstance(obj, Text):
-                            target_obj = obj
-                        elif style.target_type() == 'fill' and not isinstance(obj, Text):
-                            target_obj = obj
-                        else:
-                            target_obj = None
-                        if target_obj != None:
-                            if style.priority() > target_obj.style().priority():
-                                target_obj.set_style(style)
+            if not style.name_pattern() in matched_names:
+                matched_names[style.name_pattern()] = self.__matching_names(style.name_pattern(), names)
+            matched_targets = set()
+            for name in matched_names[style.name_pattern()]:
+                for obj in named_objects[name]:
+                    if style.target_type() == 'frame' and isinstance(obj, Polygon) and not isinstance(obj, Arrow):
+                        target_obj = obj.frame()
+                    elif style.target_type() == 'text' and isinstance(obj, Text):
+                        target_obj = obj
+                    elif style.target_type() == 'fill' and not isinstance(obj, Text):
+                        target_obj = obj
+                    else:
+                        target_obj = None
+                    if target_obj != None and not id(target_obj) in matched_targets:
+                        matched_targets.add(id(target_obj))
+                        if not id(target_obj) in target_styles:
+                            target_styles[id(target_obj)] = []
+                            targets.append(target_obj)
+                        target_styles[id(target_obj)].append(style)
+
+        for target_obj in targets:
+            for style in target_styles[id(target_obj)]:
+                if style.priority() > target_obj.style().priority():
+                    target_obj.set_style(style)
+
+        # objects with equal styles share one resolved style
+        resolved_styles = {}
+        for obj in objects:
+            if isinstance(obj, Drawable):
+                obj.resolve_style(resolved_styles)
+                if isinstance(obj, Polygon) and obj.has_frame():
+                    obj.frame().resolve_style(resolved_styles)
 
         self._parsed_data = raw_data
         self._objects = objects
         return
+
+    def __matching_names(self, name_pattern, names):
+        # patterns without special characters only match names they prefix
+        if isinstance(name_pattern, basestring) and not [c for c in name_pattern if c in StyleParser.SPECIAL_CHARACTERS]:
+            matching_names = []
+            for index in range(bisect.bisect_left(names, name_pattern), len(names)):
+                if not names[index].startswith(name_pattern):
+                    break
+                matching_names.append(names[index])
+            return matching_names
+        pattern = re.compile(name_pattern, re.UNICODE)
+        return [name for name in names if pattern.match(name)]
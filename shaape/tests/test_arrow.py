@@ -1,5 +1,6 @@
 from shaape.arrow import Arrow
 from shaape.style import Style
+from shaape.node import Node
 import nose
 import unittest
 from nose.tools import *
@@ -9,3 +10,29 @@ class TestArrow(unittest.TestCase):
     def test_init(self):
         arrow = Arrow((3, 1))
         assert type(arrow) == Arrow
+
+    def test_nodes(self):
+        glyph = [Node(-0.5, 0.2), Node(0.5, 0), Node(-0.5, -0.2)]
+        arrow = Arrow((3, 1), glyph)
+        other_arrow = Arrow((5, 2), list(glyph))
+        assert arrow.nodes() == glyph
+        assert arrow.nodes() is not glyph
+        assert [n for n, g in zip(arrow.nodes(), glyph) if n is g] == []
+        assert other_arrow.edges() == arrow.edges()
+        assert arrow.min() == (-0.5, -0.2)
+        assert arrow.max() == (0.5, 0.2)
+        assert arrow.has_frame() == False
+        arrow.nodes()[0].set_position(0, 0)
+        assert glyph[0] == Node(-0.5, 0.2)
+        assert other_arrow.nodes()[0] == Node(-0.5, 0.2)
+
+    def test_scale(self):
+        glyph = [Node(-0.5, 0.2), Node(0.5, 0), Node(-0.5, -0.2)]
+        arrow = Arrow((3, 1), glyph)
+        other_arrow = Arrow((5, 2), glyph)
+        arrow.scale((2, 10))
+        assert arrow.position() == (6, 10)
+        assert arrow.nodes() == [Node(-1, 2), Node(1, 0), Node(-1, -2)]
+        assert arrow.max() == (1, 2)
+        assert other_arrow.nodes() == glyph
+        assert glyph == [Node(-0.5, 0.2), Node(0.5, 0), Node(-0.5, -0.2)]
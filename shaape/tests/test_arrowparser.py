@@ -1,8 +1,13 @@
 from shaape.arrowparser import ArrowParser
+from shaape.overlayparser import OverlayParser
 from shaape.rightarrow import RightArrow
 from shaape.leftarrow import LeftArrow
 from shaape.uparrow import UpArrow
 from shaape.downarrow import DownArrow
+from shaape.opengraph import OpenGraph
+from shaape.polygon import Polygon
+from shaape.gridgraph import GridGraph
+from shaape.node import Node
 import nose
 import unittest
 from nose.tools import *
@@ -25,4 +30,43 @@ class TestArrowParser(unittest.TestCase):
         assert [o for o in objects if type(o) == LeftArrow]
         assert [o for o in objects if type(o) == UpArrow]
         assert [o for o in objects if type(o) == DownArrow]
-        
+
+    def test_snap(self):
+        arrowparser = ArrowParser()
+        graph = GridGraph([(Node(0, 0.5), Node(2, 0.5)), (Node(3.2, 0.5), Node(4, 0.5)), (Node(2.5, 2), Node(2.5, 3))])
+        line = OpenGraph(GridGraph([(Node(0, 0.5), Node(2, 0.5))]))
+        far_line = OpenGraph(GridGraph([(Node(2.5, 2), Node(2.5, 3))]))
+        objects = [line, far_line, graph]
+        arrowparser.run(['  >', '', '', '  ^'], objects)
+        arrows = [o for o in objects if type(o) == RightArrow or type(o) == UpArrow]
+        assert len(arrows) == 2
+        right_arrow = [o for o in arrows if type(o) == RightArrow][0]
+        up_arrow = [o for o in arrows if type(o) == UpArrow][0]
+        assert right_arrow.position() == (2.7, 0.5)
+        assert line.paths()[-1] == [Node(2, 0.5), Node(2.2, 0.5)]
+        assert up_arrow.position() == (2.5, 3.5)
+        assert len(far_line.paths()) == 1
+
+    def test_snap_polygon(self):
+        arrowparser = ArrowParser()
+        graph = GridGraph([(Node(0.5, 0.5), Node(2, 0.5)), (Node(3.5, 0.5), Node(6, 0.5))])
+        polygon = Polygon([Node(0.5, 0.5), Node(2, 0.5), Node(2, 2), Node(0.5, 2), Node(0.5, 0.5)])
+        target_polygon = Polygon([Node(3.5, 0.5), Node(6, 0.5), Node(6, 2), Node(3.5, 2), Node(3.5, 0.5)])
+        objects = [polygon, target_polygon, graph]
+        arrowparser.run(['  >'], objects)
+        right_arrow = [o for o in objects if type(o) == RightArrow][0]
+        assert right_arrow.position() == (3.0, 0.5)
+        assert polygon.has_frame() == True
+        assert polygon.frame().paths()[-1] == [Node(2, 0.5), Node(2.5, 0.5)]
+        assert target_polygon.has_frame() == False
+
+    def test_snap_straight_line(self):
+        data = ['|', '|', '|', 'v']
+        overlayparser = OverlayParser()
+        overlayparser.run(data, [])
+        objects = overlayparser.drawable_objects()
+        ArrowParser().run(data, objects)
+        lines = [o for o in objects if type(o) == OpenGraph]
+        assert len(lines) == 1
+        assert len(lines[0].paths()) == 1
+        assert sorted([n.position() for n in lines[0].paths()[0]]) == [(0.5, 0), (0.5, 3.5)]
@@ -8,6 +8,7 @@ from shaape.text import Text
 from shaape.translatable import Translatable
 from shaape.rotatable import Rotatable
 from shaape.node import Node
+from shaape.rightarrow import RightArrow
 import nose
 import unittest
 from nose.tools import *
@@ -18,7 +19,7 @@ import operator
 import os
 import copy
 import errno
-from mock import patch
+from mock import patch, MagicMock
 
 class TestCairoBackend(unittest.TestCase):
 
@@ -195,6 +196,21 @@ class TestCairoBackend(unittest.TestCase):
         self.__backend.pop_surface()
         assert TestUtils.images_equal(TestUtils.POLYGON_SHADOW_GENERATED_IMAGE, TestUtils.POLYGON_SHADOW_EXPECTED_IMAGE)
 
+    def test_apply_glyph(self):
+        ctx = MagicMock()
+        ctx.get_line_width.return_value = 1
+        self.__backend._CairoBackend__ctx = ctx
+        self.__backend.apply_glyph(RightArrow((1, 1)).nodes())
+        self.__backend.apply_glyph(RightArrow((5, 3)).nodes())
+        assert ctx.new_path.call_count == 1
+        assert ctx.copy_path.call_count == 1
+        ctx.append_path.assert_called_once_with(ctx.copy_path.return_value)
+
+        ctx.get_line_width.return_value = 2
+        self.__backend.apply_glyph(RightArrow((1, 1)).nodes())
+        assert ctx.copy_path.call_count == 2
+        assert ctx.append_path.call_count == 1
+
     def test_draw_open_graph(self):
         self.__backend.set_canvas_size(80, 80)
         self.__backend.create_canvas()
@@ -0,0 +1,37 @@
+from shaape.charactergrid import CharacterGrid
+import nose
+import unittest
+from nose.tools import *
+
+class TestCharacterGrid(unittest.TestCase):
+    def test_init(self):
+        grid = CharacterGrid()
+        assert grid != None
+        assert grid.size() == (0, 0)
+
+    def test_size(self):
+        grid = CharacterGrid(['abc', 'de'])
+        assert grid.size() == (3, 2)
+        assert grid.inside().tolist() == [[True, True, True], [True, True, False]]
+
+    def test_plane(self):
+        grid = CharacterGrid(['+-+', u'|\xfc|'])
+        assert grid.plane('\+').tolist() == [[True, False, True], [False, False, False]]
+        assert grid.plane('[^-]').tolist() == [[True, False, True], [True, True, True]]
+        assert grid.plane(u'\xfc').tolist() == [[False, False, False], [False, True, False]]
+        assert grid.plane(None).tolist() == grid.inside().tolist()
+
+    def test_non_bmp(self):
+        line = u'a\U0001F600'
+        grid = CharacterGrid([line, u'+'])
+        assert grid.size() == (len(line), 2)
+        assert grid.plane('a').tolist() == [[True] + [False] * (len(line) - 1), [False] * len(line)]
+        assert grid.count('\+') == 1
+
+    def test_positions(self):
+        grid = CharacterGrid(['+-+', '| +'])
+        xs, ys = grid.positions('\+')
+        assert zip(xs.tolist(), ys.tolist()) == [(0, 0), (2, 0), (2, 1)]
+        assert grid.count('\+') == 3
+        assert grid.count('[^\+]') == 3
+        assert grid.matches('\|', xs - 2, ys + 1).tolist() == [False, True, False]
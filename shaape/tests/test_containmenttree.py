@@ -0,0 +1,35 @@
+from shaape.containmenttree import ContainmentTree
+from shaape.polygon import Polygon
+from shaape.node import Node
+import nose
+import unittest
+from nose.tools import *
+
+class TestContainmentTree(unittest.TestCase):
+    def square(self, x, y, size):
+        return Polygon([Node(x, y), Node(x + size, y), Node(x + size, y + size), Node(x, y + size), Node(x, y)])
+
+    def test_init(self):
+        tree = ContainmentTree()
+        assert tree != None
+        assert tree.edges() == []
+
+    def test_parents(self):
+        outer = self.square(0, 0, 10)
+        middle = self.square(1, 1, 6)
+        inner = self.square(2, 2, 2)
+        beside = self.square(20, 0, 4)
+        tree = ContainmentTree([inner, beside, outer, middle])
+        assert tree.parents(outer) == []
+        assert tree.parents(middle) == [outer]
+        assert tree.parents(inner) == [middle]
+        assert tree.parents(beside) == []
+        assert sorted(tree.edges()) == sorted([(outer, middle), (middle, inner)])
+
+    def test_containing(self):
+        outer = self.square(0, 0, 10)
+        inner = self.square(2, 2, 2)
+        tree = ContainmentTree([outer, inner])
+        assert tree.containing((3, 3)) == [outer, inner]
+        assert tree.containing((8, 8)) == [outer]
+        assert tree.containing((30, 30)) == []
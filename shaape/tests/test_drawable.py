@@ -1,5 +1,6 @@
 from shaape.drawable import Drawable
 from shaape.style import Style
+from shaape.resolvedstyle import ResolvedStyle
 import nose
 import unittest
 from nose.tools import *
@@ -16,6 +17,24 @@ class TestDrawable(unittest.TestCase):
         drawable.set_style(style)
         assert drawable.style().options() == style.options()
 
+    def test_resolve_style(self):
+        drawable1 = Drawable()
+        drawable2 = Drawable()
+        style = Style(['abc'], 'line', [[0.1, 0.2, 0.3], 'dotted', 2])
+        drawable1.set_style(style)
+        drawable2.set_style(style)
+        resolved_styles = {}
+        drawable1.resolve_style(resolved_styles)
+        drawable2.resolve_style(resolved_styles)
+        assert type(drawable1.style()) == ResolvedStyle
+        assert drawable1.style() is drawable2.style()
+        assert drawable1.style().color() == [[0.1, 0.2, 0.3]]
+        assert drawable1.style().fill_type() == 'dotted'
+        assert drawable1.style().width() == 2
+        drawable1.set_style(Style([], '', ['dashed']))
+        assert type(drawable1.style()) == Style
+        assert drawable1.style().fill_type() == 'dashed'
+
     def test_min(self):
         drawable = Drawable()
         assert_raises(NotImplementedError, drawable.min)
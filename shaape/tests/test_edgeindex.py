@@ -0,0 +1,40 @@
+from shaape.edgeindex import EdgeIndex
+from shaape.polygon import Polygon
+from shaape.opengraph import OpenGraph
+from shaape.edge import Edge
+from shaape.node import Node
+import networkx as nx
+import nose
+import unittest
+from nose.tools import *
+
+class TestEdgeIndex(unittest.TestCase):
+    def test_init(self):
+        index = EdgeIndex()
+        assert index != None
+        assert index.owners(Node(0, 0), Node(1, 0)) == []
+
+    def test_owners(self):
+        polygon = Polygon([Node(0, 0), Node(1, 0), Node(1, 1), Node(0, 1), Node(0, 0)])
+        graph = nx.Graph()
+        graph.add_edge(Node(1, 0), Node(1, 1))
+        graph.add_edge(Node(1, 1), Node(2, 1))
+        opengraph = OpenGraph(graph)
+        index = EdgeIndex([polygon, opengraph])
+        assert index.owners(Node(1, 1), Node(1, 0)) == [polygon, opengraph]
+        assert index.owners(Node(0, 0), Node(0, 1)) == [polygon]
+        assert index.owners(Node(2, 1), Node(1, 1)) == [opengraph]
+        assert index.owners(Node(0, 0), Node(1, 1)) == []
+
+    def test_crossing(self):
+        polygon = Polygon([Node(0, 0), Node(2, 0), Node(2, 2), Node(0, 2), Node(0, 0)])
+        graph = nx.Graph()
+        graph.add_edge(Node(5, 0), Node(5, 2))
+        opengraph = OpenGraph(graph)
+        index = EdgeIndex([polygon, opengraph])
+        assert index.crossing(Edge(Node(1, 1), Node(3, 1))) == [polygon]
+        assert index.crossing(Edge(Node(1, 1), Node(6, 1))) == [polygon, opengraph]
+        assert index.crossing(Edge(Node(3, 1), Node(4, 1))) == []
+        assert index.crossings([Edge(Node(1, 1), Node(3, 1)), Edge(Node(3, 1), Node(4, 1)), Edge(Node(1, 1), Node(6, 1))]) == [[polygon], [], [polygon, opengraph]]
+        assert index.crossings([]) == []
+        assert polygon.has_frame() == False
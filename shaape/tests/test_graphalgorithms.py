@@ -1,6 +1,8 @@
 from shaape.graphalgorithms import *
 from shaape.node import Node
 import nose
+import numpy as np
+import math
 import unittest
 from nose.tools import *
 
@@ -15,6 +17,38 @@ class TestGraphAlgorithms(unittest.TestCase):
         reduced_path = reduce_path(path)
         assert reduced_path == [Node(-1, 0), Node(3, 0), Node(3, 3), Node(-1, 0)]
 
+    def test_can_fuse(self):
+        assert can_fuse(Node(0, 0), Node(1, 0), Node(3, 0)) == True
+        assert can_fuse(Node(0, 0), Node(1, 1), Node(2, 2)) == True
+        assert can_fuse(Node(0, 0), Node(1, 0), Node(1, 1)) == False
+        assert can_fuse(Node(0, 0), Node(1, 0, fusable = False), Node(2, 0)) == False
+
+    def test_fixed_point(self):
+        assert fixed_point((0.25, -1.5)) == (FIXED_POINT_SCALE / 4, -3 * FIXED_POINT_SCALE / 2)
+        assert fixed_point((0.1 + 0.2, 0)) == fixed_point((0.3, 0))
+
+    def test_orientation(self):
+        assert orientation((0, 0), (1, 0), (1, 1)) > 0
+        assert orientation((0, 0), (1, 0), (1, -1)) < 0
+        assert orientation((0, 0), (1, 0), (2, 0)) == 0
+
+    def test_reduced_direction(self):
+        assert reduced_direction((0, 0)) == (0, 0)
+        assert reduced_direction((0, -6)) == (0, -1)
+        assert reduced_direction((4, -6)) == (2, -3)
+
+    def test_direction_angle(self):
+        directions = [(-1, 0), (0, 1), (1, 1), (1, 0), (0, -1), (-1, -1), (2, 2), (0.35, 0.3), (-3, 7)]
+        for direction in directions:
+            assert abs(direction_angle(direction) - math.atan2(direction[1], direction[0])) < 1e-4
+        assert direction_angle((1, 1)) == direction_angle((2, 2))
+
+    def test_right_angle(self):
+        assert right_angle((1, 0), (2, 0)) == 0
+        assert abs(right_angle((1, 0), (0, 1)) - math.pi / 2) < 1e-9
+        assert abs(right_angle((1, 0), (0, -1)) - 3 * math.pi / 2) < 1e-9
+        assert abs(right_angle((1, 0), (-1, 0)) - math.pi) < 1e-9
+
     def test_has_same_direction(self):
         assert has_same_direction(Node(0, 0), Node(0, 0)) == False
         assert has_same_direction(Node(0, 0), Node(1, 0)) == False
@@ -22,14 +56,106 @@ class TestGraphAlgorithms(unittest.TestCase):
         assert has_same_direction(Node(1, 2), Node(2, 4)) == True
         assert has_same_direction(Node(1, 2), Node(-2, -4)) == True
         assert has_same_direction(Node(1, 2), Node(2, 3)) == False
+        assert has_same_direction(Node(0.1 + 0.2, 0.3), Node(0.3, 0.3)) == True
+
+    def test_planar_cycles(self):
+        graph = nx.Graph()
+        graph.add_path([Node(0, 0), Node(1, 0), Node(2, 0), Node(2, 1), Node(1, 1), Node(0, 1), Node(0, 0)])
+        graph.add_edge(Node(1, 0), Node(1, 1))
+        graph.add_edge(Node(2, 1), Node(3, 2))
+        cycles = planar_cycles(graph)
+        assert len(cycles) == 2
+        assert set([cycle_key(c[:-1]) for c in cycles]) == set([cycle_key([Node(0, 0), Node(1, 0), Node(1, 1), Node(0, 1)]), cycle_key([Node(1, 0), Node(2, 0), Node(2, 1), Node(1, 1)])])
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+
+        graph.remove_edge(Node(1, 0), Node(1, 1))
+        cycles = planar_cycles(graph)
+        assert len(cycles) == 1
+        assert len(cycles[0]) == 7
+
+    def test_crossing_edges(self):
+        graph = nx.Graph()
+        graph.add_path([Node(0, 0), Node(4, 0), Node(4, 4), Node(0, 4), Node(0, 0)])
+        graph.add_path([Node(4, 0), Node(4, -2), Node(1, -2), Node(1, 2), Node(4, 2)])
+        top = frozenset([Node(0, 0), Node(4, 0)])
+        left = frozenset([Node(1, -2), Node(1, 2)])
+        assert crossing_edges(graph) == {top: set([left]), left: set([top])}
+
+        graph.remove_edge(Node(1, -2), Node(1, 2))
+        assert crossing_edges(graph) == {}
 
-    def test_is_chord_free(self):
+    def test_crossing_cycles(self):
+        # the left side of the second box is drawn across the top of the first one
         graph = nx.Graph()
-        graph.add_edge(Node(0.5, 0.5), Node(0.5, 1.5))
-        graph.add_edge(Node(0.5, 0.5), Node(1.5, 1.5))
-        graph.add_edge(Node(0.5, 0.5), Node(1.5, 0.5))
-        graph.add_edge(Node(0.5, 1.5), Node(1.5, 1.5))
-        graph.add_edge(Node(0.5, 1.5), Node(1.5, 0.5))
-        graph.add_edge(Node(1.5, 0.5), Node(1.5, 1.5))
-        cycle = [Node(1.5, 1.5), Node(0.5, 1.5), Node(0.5, 0.5), Node(1.5, 0.5)]
-        assert is_chord_free(graph, cycle) == False
+        graph.add_path([Node(0, 0), Node(4, 0), Node(4, 2), Node(4, 4), Node(0, 4), Node(0, 0)])
+        graph.add_path([Node(4, 0), Node(4, -2), Node(1, -2), Node(1, 2), Node(4, 2)])
+        cycles = crossing_cycles(graph, crossing_edges(graph))
+        assert len(cycles) == 2
+        assert set([cycle_key(c[:-1]) for c in cycles]) == set([cycle_key([Node(0, 0), Node(4, 0), Node(4, 2), Node(4, 4), Node(0, 4)]), cycle_key([Node(1, -2), Node(4, -2), Node(4, 0), Node(4, 2), Node(1, 2)])])
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+            assert signed_area(cycle) < 0
+
+    def test_rectangle_bounds(self):
+        assert rectangle_bounds([Node(0, 0), Node(2, 0), Node(3, 0), Node(3, 1), Node(0, 1), Node(0, 0)]) == ((0, 0), (3, 1))
+        assert rectangle_bounds([Node(0, 0), Node(2, 0), Node(2, 1), Node(1, 1), Node(1, 2), Node(0, 2), Node(0, 0)]) == None
+        assert rectangle_bounds([Node(0, 0), Node(1, 0), Node(1, 1), Node(0, 0)]) == None
+        assert rectangle_bounds([Node(0, 0)]) == None
+
+    def test_rectangle_cycle(self):
+        graph = nx.Graph()
+        graph.add_path([Node(0, 0), Node(1, 0), Node(2, 0), Node(2, 1), Node(0, 1), Node(0, 0)])
+        cycle = rectangle_cycle(graph)
+        assert cycle_key(cycle[:-1]) == cycle_key([Node(0, 0), Node(1, 0), Node(2, 0), Node(2, 1), Node(0, 1)])
+        assert cycle[0] == cycle[-1]
+        assert signed_area(cycle) < 0
+
+        graph.add_edge(Node(1, 0), Node(1, 1))
+        assert rectangle_cycle(graph) == None
+
+    def test_translation_key(self):
+        graph = nx.Graph()
+        graph.add_path([Node(0, 0), Node(1, 0), Node(1, 1.35, 'curve')])
+        moved = nx.Graph()
+        moved.add_path([Node(12, 7.5), Node(13, 7.5), Node(13, 8.85, 'curve')])
+        key, relative = translation_key(graph)
+        moved_key, moved_relative = translation_key(moved)
+        assert key == moved_key
+        assert moved_relative[Node(13, 8.85)] == (1, 1.35)
+
+        curved = nx.Graph()
+        curved.add_path([Node(0, 0), Node(1, 0, 'curve'), Node(1, 1.35, 'curve')])
+        assert translation_key(curved)[0] != key
+
+    def test_cycle_key(self):
+        cycle = [Node(1, 1), Node(0, 1), Node(0, 0), Node(1, 0)]
+        assert cycle_key(cycle) == ((0, 0), (0, 1), (1, 1), (1, 0))
+        assert cycle_key(cycle[::-1]) == cycle_key(cycle)
+        assert cycle_key(cycle[2:] + cycle[:2]) == cycle_key(cycle)
+
+    def test_break_cycles(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')])
+        assert break_cycles(graph, {'a' : 0, 'b' : 1, 'c' : 2, 'd' : 3}) == True
+        assert sorted(graph.edges()) == [('c', 'a'), ('c', 'd')]
+        assert break_cycles(graph, {'a' : 0, 'b' : 1, 'c' : 2, 'd' : 3}) == False
+
+    def test_longest_path_layers(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([('a', 'b'), ('b', 'c'), ('a', 'c'), ('d', 'c')])
+        graph.add_node('e')
+        assert longest_path_layers(graph) == {'a' : 0, 'b' : 1, 'c' : 2, 'd' : 0, 'e' : 0}
+
+    def test_segment_arrays(self):
+        segments = [((0, 0), (2, 0)), ((1, -1), (1, 1)), ((3, 1), (4, 2)), ((0, 0), (0, 0))]
+        query = ((0, 1), (2, -1))
+        intersect = line_segments_intersect_array(segment_array([query])[0], segment_array(segments))
+        distance = line_segments_distance_array(segment_array([query])[0], segment_array(segments))
+        assert intersect.tolist() == [line_segments_intersect(query, segment) for segment in segments]
+        assert distance.tolist() == [line_segments_distance(query, segment) for segment in segments]
+        point_distance = line_segment_point_distance_array(np.array([3, 0]), segment_array(segments))
+        assert point_distance.tolist() == [line_segment_point_distance((3, 0), segment) for segment in segments]
+        all_distances = line_segments_distance_array(segment_array(segments)[:, np.newaxis], segment_array(segments)[np.newaxis])
+        assert all_distances.shape == (4, 4)
+        assert all_distances[0, 2] == line_segments_distance(segments[0], segments[2])
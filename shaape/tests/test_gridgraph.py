@@ -0,0 +1,58 @@
+from shaape.gridgraph import GridGraph
+from shaape.node import Node
+import nose
+import unittest
+from nose.tools import *
+
+class TestGridGraph(unittest.TestCase):
+    def test_init(self):
+        graph = GridGraph()
+        assert graph != None
+        assert graph.nodes() == []
+        assert graph.edges() == []
+
+    def test_add_edges_from(self):
+        graph = GridGraph([(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(1, 1)), (Node(0, 0), Node(1, 0))], [Node(5, 5)])
+        assert graph.nodes() == [Node(5, 5), Node(0, 0), Node(1, 0), Node(1, 1)]
+        assert graph.edges() == [(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(1, 1))]
+        assert graph.neighbors(Node(1, 0)) == [Node(0, 0), Node(1, 1)]
+        assert graph.degree(Node(1, 0)) == 2
+        assert graph.degree(Node(5, 5)) == 0
+        assert graph.has_edge(Node(1, 1), Node(1, 0)) == True
+        assert graph.has_edge(Node(0, 0), Node(1, 1)) == False
+
+    def test_representatives(self):
+        graph = GridGraph()
+        graph.add_edge(Node(0, 0, fusable = False), Node(1, 0))
+        graph.add_edge(Node(0, 0), Node(0, 1))
+        assert [node.fusable() for node in graph.neighbors(Node(0, 1))] == [False]
+
+    def test_annotation(self):
+        graph = GridGraph()
+        graph.add_edge(Node(0, 0), Node(1, 0), {'below' : None, 'z_order' : 'above'})
+        graph.add_edge(Node(1, 0), Node(2, 0), {'below' : None, 'z_order' : None})
+        assert graph.annotation(Node(1, 0), Node(0, 0)) == {'below' : None, 'z_order' : 'above'}
+        assert graph.annotation(Node(1, 0), Node(2, 0)) == {}
+        graph.add_edge(Node(0, 0), Node(1, 0), {'z_order' : None})
+        assert graph.annotation(Node(0, 0), Node(1, 0)) == {}
+
+    def test_remove(self):
+        graph = GridGraph([(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(2, 0))])
+        graph.remove_edge(Node(1, 0), Node(0, 0))
+        assert graph.edges() == [(Node(1, 0), Node(2, 0))]
+        graph.remove_node(Node(1, 0))
+        assert graph.nodes() == [Node(0, 0), Node(2, 0)]
+        assert graph.edges() == []
+        assert len(graph) == 2
+
+    def test_components(self):
+        graph = GridGraph([(Node(0, 0), Node(1, 0)), (Node(5, 0), Node(6, 0)), (Node(1, 0), Node(1, 1))], [Node(9, 9)])
+        components = graph.components()
+        assert [component.nodes() for component in components] == [[Node(9, 9)], [Node(0, 0), Node(1, 0), Node(1, 1)], [Node(5, 0), Node(6, 0)]]
+        assert components[1].edges() == [(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(1, 1))]
+
+    def test_difference(self):
+        graph = GridGraph([(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(1, 1))])
+        difference = graph.difference(GridGraph([(Node(1, 0), Node(0, 0))]))
+        assert difference.nodes() == [Node(1, 0), Node(1, 1)]
+        assert difference.edges() == [(Node(1, 0), Node(1, 1))]
@@ -0,0 +1,34 @@
+from shaape.gridlexer import GridLexer
+from shaape.charactergrid import CharacterGrid
+import nose
+import unittest
+from nose.tools import *
+
+class TestGridLexer(unittest.TestCase):
+    def test_init(self):
+        lexer = GridLexer()
+        assert lexer.parsed_data() == []
+        assert lexer.drawable_objects() == []
+
+    def test_run(self):
+        lexer = GridLexer()
+        data = ['abc +-> \'b\'', 'v  vv|']
+        objects = []
+        lexer.run(data, objects)
+        assert lexer.parsed_data() == data
+        assert len(objects) == 1
+        grid = objects[0]
+        assert type(grid) == CharacterGrid
+        assert grid.lines() == ['    +->    ', 'v    |']
+        assert grid.texts() == [('b', (9, 0)), ('abc', (0, 0)), ('vv', (3, 1))]
+        assert grid.cells(CharacterGrid.ARROW) == [(6, 0, '>'), (0, 1, 'v')]
+        assert grid.cells(CharacterGrid.JUNCTION) == [(4, 0, '+')]
+        assert grid.cells(CharacterGrid.LINE) == [(5, 0, '-'), (5, 1, '|')]
+        assert grid.kinds()[1][:6].tolist() == [CharacterGrid.ARROW, 0, 0, CharacterGrid.TEXT, CharacterGrid.TEXT, CharacterGrid.LINE]
+
+    def test_lex(self):
+        lexer = GridLexer()
+        grid = lexer.lex(['ab\'cd\'e v \'\' \'x y\'-', u'\'\u00e9t\u00e9\' vw'])
+        assert grid.lines() == ['        v \'      \'-', u'        ']
+        assert type(grid.lines()[1]) == unicode
+        assert grid.texts() == [('cd', (3, 0)), (' ', (12, 0)), ('ab', (0, 0)), ('e', (6, 0)), ('x', (14, 0)), ('y', (16, 0)), (u'\u00e9t\u00e9', (1, 1)), (u'vw', (6, 1))]
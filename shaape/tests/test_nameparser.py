@@ -1,5 +1,8 @@
 from shaape.nameparser import NameParser
 from shaape.text import Text
+from shaape.opengraph import OpenGraph
+from shaape.gridgraph import GridGraph
+from shaape.node import Node
 from shaape.tests.utils import TestUtils
 import nose
 from sets import Set
@@ -22,4 +25,13 @@ class TestNameParser(unittest.TestCase):
         parser.run(raw_data, objects)
         assert polygon.names() == Set(['', 'abc'])
 
-        
+    def test_run_graphs(self):
+        parser = NameParser()
+        near_graph = OpenGraph(GridGraph([(Node(0, 2), Node(10, 2)), (Node(10, 2), Node(10, 30))]))
+        far_graph = OpenGraph(GridGraph([(Node(0, 5), Node(10, 5))]))
+        text1 = Text("abc", (2, 1))
+        text2 = Text("def", (10.5, 20))
+        text3 = Text("ghi", (40, 40))
+        parser.run('', [near_graph, far_graph, text1, text2, text3])
+        assert near_graph.names() == Set(['', '_line_', 'abc', 'def'])
+        assert far_graph.names() == Set(['', '_line_'])
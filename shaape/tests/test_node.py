@@ -22,6 +22,13 @@ class TestNode(unittest.TestCase):
         node = Node(1.5, -0.5)
         assert node.position() == (1.5, -0.5)
 
+    def test_set_position(self):
+        node = Node(1.5, -0.5)
+        node.set_position(2.0, 3.0)
+        assert node.position() == (2.0, 3.0)
+        assert node in set([Node(2.0, 3.0)])
+        assert not node in set([Node(1.5, -0.5)])
+
     def test_fusable(self):
         node = Node(0, 0)
         assert node.fusable() == True
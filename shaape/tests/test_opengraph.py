@@ -1,5 +1,6 @@
 from shaape.opengraph import OpenGraph
 from shaape.node import Node
+from shaape.gridgraph import GridGraph
 from shaape.tests.utils import TestUtils
 import nose
 import unittest
@@ -47,6 +48,28 @@ class TestOpenGraph(unittest.TestCase):
         g.add_edge(Node(3, 0), Node(3, 2))
         opengraph = OpenGraph(g)
         assert len(opengraph.paths()) == 2
-        
 
-        
+    def test_paths_start_at_line_end(self):
+        g = GridGraph([(Node(0, 1), Node(0, 2)), (Node(0, 0), Node(0, 1)), (Node(0, 2), Node(0, 3))])
+        opengraph = OpenGraph(g)
+        assert len(opengraph.paths()) == 1
+        assert TestUtils.unordered_lists_equal([Node(0, 0), Node(0, 3)], opengraph.paths()[0])
+
+    def test_paths_after_reduce_nodes(self):
+        g = GridGraph([(Node(0, 0), Node(1, 0)), (Node(1, 0), Node(2, 0)), (Node(2, 0), Node(2, 1))])
+        opengraph = OpenGraph(g)
+        opengraph.reduce_nodes()
+        assert len(opengraph.graph().nodes()) == 3
+        assert opengraph.paths() == [[Node(0, 0), Node(2, 0), Node(2, 1)]]
+        assert opengraph.graph().has_edge(Node(0, 0), Node(2, 0))
+        opengraph.add_path([Node(2, 1), Node(2, 2)])
+        assert len(opengraph.paths()) == 2
+
+    def test_reduce_nodes(self):
+        g = GridGraph([(Node(i, 0), Node(i + 1, 0)) for i in range(0, 10)] + [(Node(10, 0), Node(10, 5)), (Node(10, 5), Node(10, 6))], [Node(5, 0, fusable = False)])
+        opengraph = OpenGraph(g)
+        opengraph.reduce_nodes()
+        assert TestUtils.unordered_lists_equal(opengraph.graph().nodes(), [Node(0, 0), Node(5, 0), Node(10, 0), Node(10, 6)])
+        assert opengraph.graph().has_edge(Node(0, 0), Node(5, 0))
+        assert opengraph.graph().has_edge(Node(5, 0), Node(10, 0))
+        assert opengraph.graph().has_edge(Node(10, 0), Node(10, 6))
@@ -1,6 +1,7 @@
 from shaape.overlay import Overlay
 from shaape.node import Node
 from shaape.edge import Edge
+from shaape.charactergrid import CharacterGrid
 import nose
 import unittest
 from nose.tools import *
@@ -15,3 +16,22 @@ class TestOverlay(unittest.TestCase):
         graph = overlay.substitutes(["  / "," +  "])
         assert len(graph.edges()) == 1
 
+    def test_step(self):
+        assert Overlay([['-']], [Edge(Node(0, 0.5), Node(1, 0.5))]).step() == (1, 0)
+        assert Overlay([["\\\\"]], [Edge(Node(1, 1), Node(0, 0))]).step() == (-1, -1)
+        assert Overlay([['\+', '-']], [Edge(Node(0.5, 0.5), Node(1, 0.5))]).step() == None
+        assert Overlay([['\+']], [Edge(Node(0.5, 0.5), Node(1, 0.5))]).step() == None
+
+    def test_runs(self):
+        overlay = Overlay([['-']], [Edge(Node(0, 0.5), Node(1, 0.5))])
+        runs = overlay.runs(['---+--', ' -'])
+        assert runs == [[Node(0, 0.5), Node(1, 0.5), Node(2, 0.5), Node(3, 0.5)], [Node(4, 0.5), Node(5, 0.5), Node(6, 0.5)], [Node(1, 1.5), Node(2, 1.5)]]
+
+    def test_matches(self):
+        overlay = Overlay([['-', '\|']])
+        grid = CharacterGrid(['-|-|', ' -|', '-'])
+        assert overlay.matches(grid) == [(0, 0), (2, 0), (1, 1)]
+        overlay = Overlay([['\|'], ['-']])
+        assert overlay.matches(grid) == [(1, 0)]
+        overlay = Overlay([['-'], ['-'], ['-'], ['-']])
+        assert overlay.matches(grid) == []
@@ -1,4 +1,6 @@
-from shaape.overlayparser import OverlayParser
+from shaape.overlayparser import OverlayParser, decompose_shape, match_band
+from shaape.overlay import Overlay
+from shaape.charactergrid import CharacterGrid
 from shaape.node import Node
 from shaape.opengraph import OpenGraph
 from shaape.polygon import Polygon
@@ -39,3 +41,56 @@ class TestOverlayParser(unittest.TestCase):
         assert len(parser.drawable_objects()) == 6, "got " + str(len(parser.drawable_objects())) + " drawable objects "
         assert len([ o for o in parser.drawable_objects() if type(o) == Polygon]) == 5
 
+    def test_run_crossed_box(self):
+        parser = OverlayParser()
+        parser.run(["     +---+", "     |   |", "+----|---+-----+", "|    |   |     |", "|    +---+     |", "|              |", "+--------------+"], [])
+        polygons = [o for o in parser.drawable_objects() if type(o) == Polygon]
+        assert len(parser.drawable_objects()) == 2
+        assert len(polygons) == 2
+        assert sorted([sorted(set([n.position() for n in p.nodes()])) for p in polygons]) == [[(0.5, 2.5), (0.5, 6.5), (9.5, 2.5), (15.5, 2.5), (15.5, 6.5)], [(5.5, 0.5), (5.5, 4.5), (9.5, 0.5), (9.5, 2.5), (9.5, 4.5)]]
+
+    def test_run_crossover_lattice(self):
+        # every row and every column of the lattice is a band drawn across the others
+        for n in [3, 6]:
+            data = ["+" + "---+" * n]
+            for row in range(0, n):
+                data.append("|" + "   |" * n)
+                if row < n - 1:
+                    data.append("+" + "---|" * (n - 1) + "---+")
+            data.append("+" + "---+" * n)
+            parser = OverlayParser()
+            parser.run(data, [])
+            polygons = [o for o in parser.drawable_objects() if type(o) == Polygon]
+            boxes = []
+            for p in polygons:
+                xs = [node[0] for node in p.nodes()]
+                ys = [node[1] for node in p.nodes()]
+                boxes.append(((min(xs), min(ys)), (max(xs), max(ys))))
+            rows = [((0.5, 0.5 + 2 * i), (4 * n + 0.5, 2.5 + 2 * i)) for i in range(0, n)]
+            columns = [((0.5 + 4 * i, 0.5), (4.5 + 4 * i, 2 * n + 0.5)) for i in range(0, n)]
+            assert len(polygons) == 2 * n
+            assert sorted(boxes) == sorted(rows + columns)
+
+    def test_jobs(self):
+        data = ["+--+ +-+", "|  | +-+--", "+--+"]
+        parser = OverlayParser()
+        parser.run(data, [])
+        parallel_parser = OverlayParser(jobs = 2)
+        parallel_parser.run(data, [])
+        assert [type(o) for o in parallel_parser.drawable_objects()] == [type(o) for o in parser.drawable_objects()]
+
+    def test_decompose_shape(self):
+        positions = [(0, 0), (1, 0), (1, 1), (0, 1), (2, 1)]
+        edges = [((0, 0), (1, 0)), ((1, 0), (1, 1)), ((1, 1), (0, 1)), ((0, 1), (0, 0)), ((1, 1), (2, 1))]
+        cycles, remaining = decompose_shape((positions, edges))
+        assert len(cycles) == 1
+        assert sorted(cycles[0][:-1]) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        assert remaining == [([(1, 1), (2, 1)], [((1, 1), (2, 1))])]
+
+    def test_match_band(self):
+        overlays = [Overlay([['\|'], ['-'], ['\|']]), Overlay([['-']])]
+        lines = ['-|-', ' - ', ' |-', ' - ']
+        grid = CharacterGrid(lines)
+        top = match_band((overlays, lines[0:3], 0, 1))
+        bottom = match_band((overlays, lines[1:4], 1, 3))
+        assert [top[i] + bottom[i] for i in range(0, 2)] == [overlay.matches(grid) for overlay in overlays]
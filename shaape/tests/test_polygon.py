@@ -10,6 +10,13 @@ class TestPolygon(unittest.TestCase):
         polygon = Polygon([Node(0, 0)])
         assert polygon != None
 
+    def test_has_edge(self):
+        polygon = Polygon([Node(0, 0), Node(1, 0), Node(1, 1), Node(0, 0)])
+        assert polygon.has_edge(Node(0, 0), Node(1, 0)) == True
+        assert polygon.has_edge(Node(1, 0), Node(0, 0)) == True
+        assert polygon.has_edge(Node(1, 1), Node(0, 0)) == True
+        assert polygon.has_edge(Node(0, 1), Node(0, 0)) == False
+
     def test_contains(self):
         polygon = TestUtils.generate_test_polygon(seed = 0, points = 12, radius_range = (5, 10))
         assert polygon.contains((2,3)) == True
@@ -19,6 +26,22 @@ class TestPolygon(unittest.TestCase):
         polygon = Polygon([Node(0, 0), Node(4, 0), Node(17, 4), Node(0, 4), Node(0, 0)])
         assert polygon.contains((8,1)) == False
 
+        polygon = Polygon([Node(0, 0), Node(4, 0), Node(4, 2), Node(0, 2), Node(0, 0)])
+        assert polygon.contains((1, 1)) == True
+        assert polygon.contains((4, 2)) == True
+        assert polygon.contains((0, 1)) == False
+        assert polygon.contains((5, 1)) == False
+        assert polygon.min() == (0, 0)
+        assert polygon.max() == (4, 2)
+
+    def test_contains_points(self):
+        polygon = Polygon([Node(0, 0), Node(4, 0), Node(17, 4), Node(0, 4), Node(0, 0)])
+        points = [(8, 1), (2, 3), (-1, 2), (16, 3.9)]
+        assert polygon.contains_points(points).tolist() == [polygon.contains(point) for point in points]
+
+        polygon = Polygon([Node(0, 0), Node(4, 0), Node(4, 2), Node(0, 2), Node(0, 0)])
+        assert polygon.contains_points([(1, 1), (4, 2), (0, 1), (5, 1)]).tolist() == [True, True, False, False]
+
     def test_nodes(self):
         polygon = Polygon([Node(0, 0), Node(4, 0)])
         assert polygon.nodes() == [Node(0, 0), Node(4, 0)]
@@ -32,9 +55,17 @@ class TestPolygon(unittest.TestCase):
         polygon = Polygon([Node(-1, 5), Node(4, 1)])
         polygon.scale((2, 3))
         assert polygon.nodes() == [Node(-2, 15), Node(8, 3)]
+        assert polygon.min() == (-2, 3)
+        assert polygon.max() == (8, 15)
+        assert polygon.has_edge(Node(8, 3), Node(-2, 15)) == True
 
     def test_frame(self):
         polygon = Polygon([Node(-1, 5), Node(4, 1)])
+        assert polygon.has_frame() == False
         assert len(polygon.frame().paths()) == 1
+        assert polygon.has_frame() == True
         assert len(polygon.frame().paths()[0]) == 2
         assert TestUtils.unordered_lists_equal([Node(-1, 5), Node(4, 1)], polygon.frame().paths()[0])
+        polygon = Polygon([Node(-1, 5), Node(4, 1)])
+        polygon.scale((2, 3))
+        assert TestUtils.unordered_lists_equal([Node(-2, 15), Node(8, 3)], polygon.frame().paths()[0])
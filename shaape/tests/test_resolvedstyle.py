@@ -0,0 +1,35 @@
+from shaape.resolvedstyle import ResolvedStyle
+from shaape.style import Style
+import nose
+import unittest
+from nose.tools import *
+
+class TestResolvedStyle(unittest.TestCase):
+
+    def test_init(self):
+        style = ResolvedStyle(Style('abc', 'fill', ['red', 'no-shadow', 3, 'dashed'], 2))
+        assert style.name_pattern() == 'abc'
+        assert style.target_type() == 'fill'
+        assert style.priority() == 2
+        assert style.color() == [Style.COLORS['red']]
+        assert style.shadow() == 'off'
+        assert style.width() == 3
+        assert style.fill_type() == 'dashed'
+        assert style.font().name() == Style.DEFAULT_STYLE['font'].name()
+
+    def test_defaults(self):
+        style = ResolvedStyle(Style())
+        assert style.color() == Style.DEFAULT_STYLE['color']
+        assert style.shadow() == Style.DEFAULT_STYLE['shadow']
+        assert style.width() == Style.DEFAULT_STYLE['width']
+        assert style.fill_type() == Style.DEFAULT_STYLE['type']
+
+    def test_key(self):
+        style1 = ResolvedStyle(Style('abc', 'fill', [[0.1, 0.2, 0.3], 'dotted'], 1))
+        style = Style('def', 'fill', ['dotted'], 1)
+        style.add_color((0.1, 0.2, 0.3))
+        style2 = ResolvedStyle(style)
+        style3 = ResolvedStyle(Style('abc', 'fill', [[0.1, 0.2, 0.3], 'dashed'], 1))
+        assert style1.key() == style2.key()
+        assert style1.key() != style3.key()
+        assert hash(style1.key()) == hash(style2.key())
@@ -0,0 +1,21 @@
+from shaape.spatialindex import SpatialIndex
+import nose
+import unittest
+from nose.tools import *
+
+class TestSpatialIndex(unittest.TestCase):
+    def test_init(self):
+        index = SpatialIndex()
+        assert index != None
+        assert len(index) == 0
+
+    def test_query(self):
+        index = SpatialIndex(4)
+        index.insert('a', (0, 0), (10, 10))
+        index.insert('b', (20, 20))
+        index.insert('c', (-5, -5), (-1, -1))
+        assert len(index) == 3
+        assert index.query((5, 5)) == ['a']
+        assert index.query((21, 21)) == ['b']
+        assert index.query((-3, -3), (30, 30)) == ['a', 'b', 'c']
+        assert index.query((100, 100)) == []
@@ -1,10 +1,12 @@
 from shaape.styleparser import StyleParser
 from shaape.style import Style
+from shaape.resolvedstyle import ResolvedStyle
 from shaape.polygon import Polygon
 from shaape.opengraph import OpenGraph
 from shaape.arrow import Arrow
 from shaape.node import Node
 from shaape.background import Background
+from shaape.text import Text
 import nose
 import unittest
 from nose.tools import *
@@ -47,3 +49,28 @@ class TestStyleParser(unittest.TestCase):
         assert polygon2.frame().style().color() == custom_frame_style.color()
         assert polygon3.frame().style().color() == custom_frame_style.color()
 
+        assert polygon2.style() is polygon3.style()
+        assert polygon2.frame().style() is polygon3.frame().style()
+        assert polygon1.style() is not polygon2.style()
+        assert type(arrow.style()) == ResolvedStyle
+        assert arrow.has_frame() == False
+
+    def test_run_name_patterns(self):
+        parser = StyleParser()
+        prefix_style = Style('line', 'fill', ['dashed'], 0)
+        regex_style = Style('l.*s$', 'fill', ['dotted'], 1)
+        text_style = Style('line', 'text', [[0.1, 0.2, 0.3]], 2)
+        opengraph1 = OpenGraph()
+        opengraph1.add_name('line')
+        opengraph2 = OpenGraph()
+        opengraph2.add_name('lines')
+        opengraph3 = OpenGraph()
+        opengraph3.add_name('lin')
+        text = Text('line')
+        text.add_name('line')
+        objects = [prefix_style, regex_style, text_style, opengraph1, opengraph2, opengraph3, text]
+        parser.run([], objects)
+        assert opengraph1.style().fill_type() == 'dashed'
+        assert opengraph2.style().fill_type() == 'dotted'
+        assert opengraph3.style().fill_type() == 'solid'
+        assert text.style().color() == text_style.color()
@@ -3,8 +3,10 @@ from arrow import Arrow
 from polygon import Polygon
 
 class UpArrow(Arrow):
+    GLYPH = [Node(-0.4, 0.0), Node(0, -0.5), Node(0.4, 0.0)]
+
     def __init__(self, position = (0, 0)):
-        Arrow.__init__(self, position, [Node(-0.4, 0.0), Node(0, -0.5), Node(0.4, 0.0)])
+        Arrow.__init__(self, position, UpArrow.GLYPH)
 
     def direction(self):
         return Node(0, -1)